@@ -2,55 +2,307 @@
 # EVCharging System - EV_Central (Control Center) - UPDATED MESSAGES
 # ============================================================================
 
+import os
+import itertools
+import logging
 import socket
+import selectors
+import signal
+import queue
+import random
 import threading
 import time
 import sys
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from logging.handlers import QueueHandler, QueueListener
 from shared.encryption import EncryptionManager
 from shared.audit_logger import log_auth, log_charge, log_fault, log_state
-from config import REGISTRY_URL, REGISTRY_POLL_INTERVAL
+from config import REGISTRY_URL, REGISTRY_POLL_INTERVAL, REGISTRY_POLL_MAX_BACKOFF
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Optional
 from config import (
-    CENTRAL_HOST, CENTRAL_PORT, CP_STATES, COLORS
+    CENTRAL_HOST, CENTRAL_PORT, CENTRAL_WORKERS, CENTRAL_REACTORS, CENTRAL_MAX_PENDING, CENTRAL_MAX_OUTBUF,
+    CENTRAL_SOCKET_BUFFER, CENTRAL_KEEPALIVE,
+    CENTRAL_ADMIN_SOCKET, CENTRAL_ADMIN_PORT, CENTRAL_STORAGE_QUEUE_SIZE, CENTRAL_LOG_LEVEL,
+    CENTRAL_HTTP_THREADS,
+    CP_STATES, COLORS, KAFKA_QUEUE_SIZE, ETX
 )
 from flask import Flask, jsonify, request
 from flask_cors import CORS
+try:
+    from waitress import serve
+except ImportError:
+    # Fall back to Werkzeug's development server
+    serve = None
 from shared.protocol import Protocol, MessageTypes
 from shared.kafka_client import KafkaClient
+from shared.events import (
+    CPRegistered, ChargeAuthorized, ChargeCompleted, ChargeManuallyEnded,
+    CPStatus, WeatherEvent
+)
 from shared.file_storage import FileStorage
+from shared.flask_json import ORJSONProvider
+
+
+# Preallocated per-connection receive buffer, filled with recv_into. Frames
+# are tens of bytes, so this holds a deep pipeline; it grows if one frame
+# ever doesn't fit. Kept small so thousands of idle CPs stay cheap
+RECV_BUFFER_SIZE = 8 * 1024
+
+# Connections accepted per listening-socket wakeup; bounded so a connect
+# storm can't starve reads on the sockets a reactor already serves
+ACCEPT_BATCH = 64
+
+# Selectors that keep registrations in the kernel see interest changes a
+# worker thread makes (EVENT_WRITE for outbuf, reads resumed after
+# backpressure) while select() blocks. select()/poll() based ones (e.g. on
+# Windows) only read registrations when called, so their reactors wake at
+# least every REACTOR_POLL_TIMEOUT seconds to pick such changes up
+KERNEL_SELECTORS = tuple(
+    getattr(selectors, name)
+    for name in ("EpollSelector", "KqueueSelector", "DevpollSelector")
+    if hasattr(selectors, name)
+)
+REACTOR_POLL_TIMEOUT = 0.05
+
+# FileStorage writes that rewrite a whole file keyed by their first
+# argument; within one writer batch only the newest call per key is applied
+COALESCED_WRITES = frozenset({"save_cp", "save_driver", "save_cp_secret"})
+
+# Most recent charging sessions kept in memory for history reads
+HISTORY_CACHE_SIZE = 1024
+
+
+@dataclass(slots=True)
+class ChargingPoint:
+    """Live state of a charging point; change fields while holding `lock`"""
+    state: str
+    location: tuple
+    price_per_kwh: float
+    connected_at: Optional[float] = None  # time.time() of registration
+    current_driver: Optional[str] = None
+    driver_socket: Optional[socket.socket] = field(default=None, repr=False, compare=False)
+    kwh_delivered: float = 0
+    amount_euro: float = 0
+    kwh_needed: float = 10
+    session_start: Optional[float] = None
+    charging_complete: bool = False
+    # State this CP is counted under in EVCentral._state_counts
+    counted_state: Optional[str] = field(default=None, repr=False, compare=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def clear_session(self):
+        """Drop the current charging session's fields; call with `lock` held"""
+        self.current_driver = None
+        self.driver_socket = None
+        self.kwh_delivered = 0
+        self.amount_euro = 0
+        self.session_start = None
+        self.charging_complete = False
+
+
+@dataclass(slots=True)
+class Driver:
+    """Live state of a connected driver; fields guarded by its own lock"""
+    status: str = "IDLE"
+    current_cp: Optional[str] = None
+    charge_amount: float = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+
+log = logging.getLogger("evcentral")
+
+
+def _setup_logging():
+    """Route the evcentral logger through a queue so handlers never block on stdout"""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("[EV_Central] %(message)s"))
+
+    log_queue = queue.Queue()
+    listener = QueueListener(log_queue, handler)
+    log.addHandler(QueueHandler(log_queue))
+    log.setLevel(CENTRAL_LOG_LEVEL)
+    log.propagate = False
+    listener.start()
+    return listener
+
+
+@lru_cache(maxsize=4096)
+def _cached_frame(*fields):
+    """Encoded unencrypted frame; ACKs, DENYs and monitor notices repeat verbatim"""
+    return Protocol.encode(Protocol.build_message(*fields), None)
+
+
+def _encode(key, *fields):
+    """Encode a message, reusing the cached frame when there is no key.
+
+    Fernet tokens embed a fresh IV and timestamp, so encrypted frames are
+    never cached.
+    """
+    if key is None:
+        return _cached_frame(*fields)
+    return Protocol.encode(Protocol.build_message(*fields), key)
+
+
+class ClientConnection:
+    """Per-socket state owned by the reactor"""
+
+    __slots__ = (
+        "sock", "client_id", "sel", "buffer", "view", "read_pos", "write_pos",
+        "pending", "scheduled", "closing", "paused", "outbuf", "events", "lock",
+        "entities", "corked",
+    )
+
+    def __init__(self, sock, client_id, sel):
+        self.sock = sock
+        self.client_id = client_id
+        self.sel = sel            # Reactor this socket is registered with
+        self.buffer = bytearray(RECV_BUFFER_SIZE)
+        self.view = memoryview(self.buffer)
+        self.read_pos = 0         # Start of the first unconsumed frame
+        self.write_pos = 0        # End of the bytes received so far
+        self.pending = deque()    # Decoded messages waiting for a worker
+        self.scheduled = False    # A worker is currently draining `pending`
+        self.closing = False      # Peer hung up, close once `pending` is empty
+        self.paused = False       # Reads suspended until `pending` drains
+        self.outbuf = bytearray() # Bytes the socket could not take yet
+        self.events = selectors.EVENT_READ  # Current selector registration
+        self.lock = threading.Lock()
+        self.entities = []        # (map, id) entries registered on this socket
+        self.corked = False       # Replies held in outbuf until the batch ends
 
 
 class EVCentral:
-    def __init__(self, host=CENTRAL_HOST, port=CENTRAL_PORT):
+    def __init__(self, host=CENTRAL_HOST, port=CENTRAL_PORT, admin_path=CENTRAL_ADMIN_SOCKET):
         self.host = host
         self.port = port
         self.server_socket = None
+        self.server_sockets = []
+        self.admin_path = admin_path
+        self.admin_socket = None
         self.running = True
 
+        # Reactors: each selector thread multiplexes its share of client
+        # sockets and hands decoded messages to a bounded pool of workers.
+        # self.sel is the main reactor, which also serves the admin socket
+        self.sel = selectors.DefaultSelector()
+        self.reactors = [self.sel]
+        self.workers = ThreadPoolExecutor(
+            max_workers=CENTRAL_WORKERS, thread_name_prefix="ev-worker"
+        )
+        # stop() writes a byte here so reactors blocked in select() with no
+        # timeout see `running` go False; it is never read
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+
+        # Set by handlers whenever dashboard-visible state changes
+        self._dirty = threading.Event()
+        # Bumped with _dirty (see _state_changed); REST bodies cached in
+        # _json_cache are reused until it moves. Values come from a shared
+        # counter so concurrent bumps never reuse a version
+        self._versions = itertools.count(1)
+        self._state_version = 0
+        self._json_cache = {}         # route name -> (version, body, etag)
+
+        # Message type → handler(fields, client_socket, client_id)
+        self._handlers = {
+            MessageTypes.REGISTER: self._handle_register,
+            MessageTypes.HEARTBEAT: self._handle_heartbeat,
+            MessageTypes.REQUEST_CHARGE: self._handle_charge_request,
+            MessageTypes.QUERY_AVAILABLE_CPS: self._handle_query_available_cps,
+            MessageTypes.SUPPLY_UPDATE: self._handle_supply_update,
+            MessageTypes.SUPPLY_END: self._handle_supply_end,
+            MessageTypes.END_CHARGE: self._handle_end_charge,
+            MessageTypes.FAULT: self._handle_fault,
+            MessageTypes.RECOVERY: self._handle_recovery,
+        }
+
+        # evctl command word → handler(args) returning the reply text
+        self._admin_commands = {
+            "help": self._admin_help,
+            "list": self._admin_list,
+            "history": self._admin_history,
+            "quit": self._admin_quit,
+            "stop": self._admin_stop,
+            "resume": self._admin_resume,
+        }
+
         # File storage instead of database
         self.storage = FileStorage("data")
+        # Writes are applied in order by _storage_worker so handlers never
+        # wait on file I/O; reads other than history go straight to
+        # self.storage
+        self._storage_q = queue.Queue(maxsize=CENTRAL_STORAGE_QUEUE_SIZE)
+        self._storage_thread = None
+        # Tail of the charging history, oldest first, so history reads
+        # don't go back to the file; appended as sessions are booked
+        self._history = deque(self.storage.get_recent_history(HISTORY_CACHE_SIZE),
+                              maxlen=HISTORY_CACHE_SIZE)
 
         # Runtime data (in-memory for active sessions)
         self.charging_points = {}     
         self.drivers = {}             
-        self.active_connections = {}  
         self.entity_to_socket = {}    
         self.monitors = {}            
-
-        # Kafka client
+        self.connections = {}         # socket -> ClientConnection
+        # Immutable (id, record) tuples of charging_points and drivers,
+        # replaced whole under the membership lock whenever an entry is
+        # added, replaced or removed. Readers (REST, dashboard, admin list)
+        # just load the current tuple: no lock, no copy per request
+        self._cp_snapshot = ()
+        self._driver_snapshot = ()
+        # Running totals behind /api/status: CPs per state and drivers
+        # currently CHARGING, moved at each transition under _counts_lock
+        self._state_counts = Counter()
+        self._charging_drivers = 0
+        self._counts_lock = threading.Lock()
+        # CPs that are ACTIVATED with no driver, mapped to their pre-built
+        # "cp_id#lat#lon#price" reply segment; kept in step with state
+        # changes (under each cp.lock) so queries skip the full scan
+        self._available_cps = {}
+        # Encoded AVAILABLE_CPS reply, joined from the segments on the first
+        # query after the index changes; both guarded by _available_lock
+        self._available_frame = None
+        self._available_lock = threading.Lock()
+
+        # Kafka client, fed by a publisher thread so handlers never block on it
         self.kafka = KafkaClient("EV_Central")
-
-        # Lock for thread safety
+        self._kafka_q = queue.Queue(maxsize=KAFKA_QUEUE_SIZE)
+        self._kafka_thread = None
+
+        # Latest SUPPLY_UPDATE per driver, every queued monitor frame per
+        # CP and session TICKETs, all drained by _update_forwarder. TICKETs
+        # go through the same thread so they always follow any update it
+        # has already taken for that driver
+        self._pending_updates = {}
+        self._pending_monitor = {}
+        self._pending_tickets = []
+        self._updates_cv = threading.Condition()
+
+        # self.lock guards membership of charging_points, entity_to_socket,
+        # monitors and weather_alerts: take it to add/remove entries, but a
+        # single .get() is atomic and needs no lock, and CPs are iterated
+        # through _cp_snapshot. drivers_lock does the same for membership
+        # of self.drivers and _driver_snapshot. Each ChargingPoint and
+        # Driver carries its own lock for field mutations, so sessions on
+        # different CPs never contend. Never hold any of them across
+        # socket/Kafka I/O.
         self.lock = threading.Lock()
+        self.drivers_lock = threading.Lock()
 
         # ============== FLASK APP ==============
         self.app = Flask(__name__)
+        self.app.json = ORJSONProvider(self.app)
         CORS(self.app)  # Enable CORS for web frontend
         self._setup_flask_routes()
 
-        # Weather alerts storage
-        self.weather_alerts = []
+        # Weather alerts storage: the active alert per CP, keyed by cp_id
+        self.weather_alerts = {}
 
         print("[EV_Central] Initializing with file storage...")
         
@@ -60,11 +312,24 @@ class EVCentral:
         self.encryption = EncryptionManager()
         self.cp_encryption_keys = {}  # cp_id -> symmetric key
         self.cp_credentials = {}  # cp_id -> {"username": ..., "secret": ...}
+        self.cp_secrets = {}  # cp_id -> secret, read through from storage
+
+        # One pooled connection for the Registry poll
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+        self._registry_etag = None
 
 
     def _is_authenticated(self, cp_id, secret):
         """Check if CP secret is valid"""
-        stored = self.storage.get_cp_secret(cp_id)
+        # Runs for every CP frame: only go to the secrets file on a miss
+        stored = self.cp_secrets.get(cp_id)
+        if stored is None:
+            stored = self.storage.get_cp_secret(cp_id)
+            if stored is not None:
+                self.cp_secrets[cp_id] = stored
         return stored is not None and stored == secret
 
     def _load_stored_cps(self):
@@ -75,137 +340,512 @@ class EVCentral:
             print(f"[EV_Central] Loading {len(stored_cps)} charging points from storage...")
             
             for cp_data in stored_cps:
-                cp_id = cp_data['cp_id']
-                self.charging_points[cp_id] = {
-                    "state": CP_STATES["DISCONNECTED"],
-                    "location": (cp_data['latitude'], cp_data['longitude']),
-                    "price_per_kwh": cp_data['price_per_kwh'],
-                    "current_driver": None,
-                    "kwh_delivered": 0,
-                    "amount_euro": 0,
-                    "session_start": None,
-                    "charging_complete": False
-                }
+                cp_id = sys.intern(cp_data['cp_id'])
+                cp = ChargingPoint(
+                    state=CP_STATES["DISCONNECTED"],
+                    location=(cp_data['latitude'], cp_data['longitude']),
+                    price_per_kwh=cp_data['price_per_kwh']
+                )
+                self._count_state(cp, cp.state)
+                self.charging_points[cp_id] = cp
                 print(f"  - {cp_id} at ({cp_data['latitude']}, {cp_data['longitude']})")
+            self._snapshot_cps()
         else:
             print("[EV_Central] No stored charging points found")
 
     def _registry_polling_loop(self):
         """Continuously poll Registry for new CPs"""
+        delay = REGISTRY_POLL_INTERVAL
         while self.running:
-            time.sleep(REGISTRY_POLL_INTERVAL)
+            # Up to 20% jitter so several EV_Central instances started
+            # together don't hit the Registry in lockstep
+            time.sleep(delay + random.uniform(0, 0.2 * delay))
             
             try:
-                response = requests.get(f"{REGISTRY_URL}/list", timeout=5)
+                # Conditional GET on a kept-alive connection: an unchanged
+                # list costs a 304 with no body and no diff
+                headers = {"If-None-Match": self._registry_etag} if self._registry_etag else None
+                response = self.http.get(f"{REGISTRY_URL}/list", headers=headers, timeout=5)
+                response.raise_for_status()
+                delay = REGISTRY_POLL_INTERVAL
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    self._registry_etag = response.headers.get("ETag")
+                    data = orjson.loads(response.content)
                     registry_cps = data.get("charging_points", [])
                     
+                    registry_cp_ids = {cp['cp_id'] for cp in registry_cps}
+                    added = []
                     with self.lock:
+                        # Both differences are fresh sets, so the dict can
+                        # be changed while walking them
+                        new_cp_ids = registry_cp_ids - self.charging_points.keys()
+                        removed = self.charging_points.keys() - registry_cp_ids
+
                         # Check for new CPs
-                        for cp_data in registry_cps:
-                            cp_id = cp_data['cp_id']
-                            
-                            if cp_id not in self.charging_points:
-                                # New CP detected!
-                                self.charging_points[cp_id] = {
-                                    "state": CP_STATES["DISCONNECTED"],
-                                    "location": (cp_data['latitude'], cp_data['longitude']),
-                                    "price_per_kwh": cp_data.get('price_per_kwh', 0.30),
-                                    "current_driver": None,
-                                    "kwh_delivered": 0,
-                                    "amount_euro": 0,
-                                    "session_start": None,
-                                    "charging_complete": False
-                                }
-                                print(f"\n[EV_Central] 🆕 NEW CP DETECTED: {cp_id} at ({cp_data['latitude']}, {cp_data['longitude']})\n")
+                        if new_cp_ids:
+                            for cp_data in registry_cps:
+                                cp_id = sys.intern(cp_data['cp_id'])
+                                if cp_id in new_cp_ids:
+                                    # New CP detected!
+                                    new_cp_ids.discard(cp_id)
+                                    cp = ChargingPoint(
+                                        state=CP_STATES["DISCONNECTED"],
+                                        location=(cp_data['latitude'], cp_data['longitude']),
+                                        price_per_kwh=cp_data.get('price_per_kwh', 0.30)
+                                    )
+                                    self._count_state(cp, cp.state)
+                                    self.charging_points[cp_id] = cp
+                                    added.append(cp_data)
                         
                         # Check for removed CPs
-                        registry_cp_ids = {cp['cp_id'] for cp in registry_cps}
-                        current_cp_ids = list(self.charging_points.keys())
-                        
-                        for cp_id in current_cp_ids:
-                            if cp_id not in registry_cp_ids:
-                                # CP was removed from Registry
-                                del self.charging_points[cp_id]
-                                print(f"\n[EV_Central] ❌ CP REMOVED: {cp_id}\n")
+                        for cp_id in removed:
+                            # CP was removed from Registry
+                            cp = self.charging_points.pop(cp_id)
+                            with cp.lock:
+                                self._count_state(cp, None)
+                            self._set_available(cp_id, None)
+
+                        if added or removed:
+                            self._snapshot_cps()
+
+                    for cp_data in added:
+                        log.info("🆕 NEW CP DETECTED: %s at (%s, %s)",
+                                 cp_data['cp_id'], cp_data['latitude'], cp_data['longitude'])
+                    for cp_id in removed:
+                        log.info("❌ CP REMOVED: %s", cp_id)
+                    if added or removed:
+                        self._state_changed()
             
             except Exception as e:
-                # Silent fail - Registry might be temporarily unavailable
-                pass
+                # Silent fail - Registry might be temporarily unavailable;
+                # back off so a down Registry isn't hammered on recovery
+                delay = min(delay * 2, REGISTRY_POLL_MAX_BACKOFF)
 
     def start(self):
         """Start the central system"""
         print(f"[EV_Central] Starting on {self.host}:{self.port}")
 
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.server_socket.bind((self.host, self.port))
-        self.server_socket.listen(5)
+        # With SO_REUSEPORT every reactor gets its own listening socket and
+        # the kernel spreads incoming connections across them
+        reactors = CENTRAL_REACTORS if hasattr(socket, "SO_REUSEPORT") else 1
+
+        self.server_socket = self._listen(self.port, reactors > 1)
+        self.server_sockets = [self.server_socket]
+        port = self.server_socket.getsockname()[1]
+        for _ in range(reactors - 1):
+            self.server_sockets.append(self._listen(port, True))
 
-        print(f"[EV_Central] Listening on port {self.port}")
+        self.reactors = [self.sel] + [selectors.DefaultSelector() for _ in range(reactors - 1)]
+        for sel, server_socket in zip(self.reactors, self.server_sockets):
+            sel.register(server_socket, selectors.EVENT_READ, partial(self._accept_client, sel))
+            sel.register(self._wakeup_r, selectors.EVENT_READ, lambda sock: None)
+
+        print(f"[EV_Central] Listening on port {port} ({reactors} reactor(s))")
         print(f"[EV_Central] File storage location: data/")
 
-        try:
-            while self.running:
-                try:
-                    client_socket, client_address = self.server_socket.accept()
-                    client_id = f"{client_address[0]}:{client_address[1]}"
-                    self.active_connections[client_id] = client_socket
-
-                    thread = threading.Thread(
-                        target=self._handle_client,
-                        args=(client_socket, client_id),
-                        daemon=True
-                    )
-                    thread.start()
-
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    if self.running:
-                        print(f"[EV_Central] Accept error: {e}")
+        self._open_admin_socket()
+
+        self._kafka_thread = threading.Thread(target=self._kafka_worker, daemon=True)
+        self._kafka_thread.start()
+
+        self._storage_thread = threading.Thread(target=self._storage_worker, daemon=True)
+        self._storage_thread.start()
 
+        threading.Thread(target=self._update_forwarder, daemon=True).start()
+
+        for sel in self.reactors[1:]:
+            threading.Thread(target=self._run_reactor, args=(sel,), daemon=True).start()
+
+        try:
+            self._run_reactor(self.sel)
         except KeyboardInterrupt:
             print("[EV_Central] Shutting down...")
         finally:
             self.shutdown()
 
-    def _handle_client(self, client_socket, client_id):
-        """Handle individual client connection"""
-        print(f"[EV_Central] Client connected: {client_id}")
+    def _listen(self, port, reuse_port):
+        """Create a non-blocking listening socket"""
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port:
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        server_socket.bind((self.host, port))
+        # Room for a whole fleet of CPs reconnecting at once
+        server_socket.listen(1024)
+        server_socket.setblocking(False)
+        return server_socket
+
+    def _run_reactor(self, sel):
+        """Event loop for one selector and the connections it accepted"""
+        timeout = None if isinstance(sel, KERNEL_SELECTORS) else REACTOR_POLL_TIMEOUT
+        while self.running:
+            try:
+                # Sleep until there is I/O or stop() wakes us
+                events = sel.select(timeout)
+            except (OSError, ValueError):
+                # Selector closed during shutdown
+                break
+
+            for key, mask in events:
+                if isinstance(key.data, ClientConnection):
+                    if mask & selectors.EVENT_WRITE:
+                        self._flush_client(key.data)
+                    if mask & selectors.EVENT_READ:
+                        self._handle_client(key.data)
+                else:
+                    # Listening and admin sockets carry their own callback
+                    key.data(key.fileobj)
 
+    def _publish(self, topic_key, event_type, data):
+        """Queue a Kafka event for the publisher thread"""
         try:
-            buffer = b''
-            while self.running:
-                data = client_socket.recv(4096)
-                if not data:
+            self._kafka_q.put_nowait((topic_key, event_type, data))
+        except queue.Full:
+            # Kafka is down or slow: drop rather than stall CP traffic
+            log.warning("⚠️  Kafka queue full, dropping %s", event_type)
+
+    def _kafka_worker(self):
+        """Drain queued events into Kafka off the request path"""
+        while True:
+            batch = [self._kafka_q.get()]
+            while True:
+                try:
+                    batch.append(self._kafka_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            # None is the shutdown sentinel: publish what came before it
+            stop = None in batch
+            if stop:
+                batch = batch[:batch.index(None)]
+            self.kafka.publish_batch(batch)
+            if stop:
+                return
+
+    def _store(self, method, *args):
+        """Queue a FileStorage write for the storage writer thread"""
+        # Unlike Kafka events these are the system of record: block rather
+        # than drop if the writer falls behind
+        self._storage_q.put((method, args))
+
+    def _storage_worker(self):
+        """Apply queued FileStorage writes off the request path"""
+        while True:
+            batch = [self._storage_q.get()]
+            while True:
+                try:
+                    batch.append(self._storage_q.get_nowait())
+                except queue.Empty:
                     break
 
-                buffer += data
+            # None is the shutdown sentinel: apply what came before it
+            stop = None in batch
+            if stop:
+                batch = batch[:batch.index(None)]
+
+            # Each save_cp/save_driver rewrites its whole file, so a burst
+            # of them for one key collapses into a single write. The newest
+            # arguments take the slot of the first call, keeping it ahead of
+            # an update_driver_stats that needs the driver to exist
+            writes = {}
+            for i, (method, args) in enumerate(batch):
+                writes[(method, args[0]) if method in COALESCED_WRITES else i] = (method, args)
 
-                while len(buffer) > 0:
-                    # Decode without key first (key resolved later in _process_message)
-                    message, is_valid = Protocol.decode(buffer, None)
+            for method, args in writes.values():
+                try:
+                    getattr(self.storage, method)(*args)
+                except Exception as e:
+                    log.warning("⚠️  Storage %s failed: %s", method, e)
+            if stop:
+                return
 
-                    if is_valid:
-                        etx_pos = buffer.find(b'\x03')
-                        buffer = buffer[etx_pos + 2:]
-                        self._process_message(message, client_socket, client_id)
-                    else:
-                        break
+    def _accept_client(self, sel, server_socket):
+        """Accept pending connections and register them with this reactor"""
+        # After an outage the whole fleet reconnects at once: take a batch
+        # of the backlog per wakeup instead of one socket per select()
+        for _ in range(ACCEPT_BATCH):
+            try:
+                client_socket, client_address = server_socket.accept()
+            except BlockingIOError:
+                return
+            except Exception as e:
+                if self.running:
+                    log.warning("Accept error: %s", e)
+                return
 
+            client_id = f"{client_address[0]}:{client_address[1]}"
+            self._configure_client_socket(client_socket)
+
+            conn = ClientConnection(client_socket, client_id, sel)
+            self.connections[client_socket] = conn
+            sel.register(client_socket, selectors.EVENT_READ, conn)
+            log.info("Client connected: %s", client_id)
+
+    def _configure_client_socket(self, client_socket):
+        """Tune an accepted socket for small, latency-sensitive frames"""
+        client_socket.setblocking(False)
+        # Every frame is a complete message: don't let Nagle hold it back
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Probe an idle peer after a few seconds instead of the kernel's two
+        # hours, so a CP that lost power is reaped and marked DISCONNECTED
+        idle, interval, count = CENTRAL_KEEPALIVE
+        for option, value in (("TCP_KEEPIDLE", idle), ("TCP_KEEPINTVL", interval), ("TCP_KEEPCNT", count)):
+            if hasattr(socket, option):
+                client_socket.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        if CENTRAL_SOCKET_BUFFER:
+            # Room for a burst of STOP/TICKET/update frames without the
+            # kernel waiting on window updates; outbuf covers the rest
+            client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, CENTRAL_SOCKET_BUFFER)
+            client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, CENTRAL_SOCKET_BUFFER)
+        if hasattr(socket, "TCP_QUICKACK"):
+            # Linux: ACK the first frames (REGISTER and friends) right away
+            # instead of waiting out the delayed-ACK timer
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+    def _handle_client(self, conn):
+        """Read from a ready client socket and queue complete messages"""
+        buffer = conn.buffer
+        if conn.write_pos == len(buffer):
+            # A single frame larger than the buffer: grow it
+            conn.view.release()
+            buffer.extend(bytes(len(buffer)))
+            conn.view = memoryview(buffer)
+
+        try:
+            n = conn.sock.recv_into(conn.view[conn.write_pos:])
+        except BlockingIOError:
+            return
         except Exception as e:
-            print(f"[EV_Central] Error handling {client_id}: {e}")
-        finally:
+            log.warning("Error handling %s: %s", conn.client_id, e)
+            n = 0
+
+        if not n:
+            self._disconnect_client(conn)
+            return
+
+        start = conn.write_pos
+        conn.write_pos += n
+
+        messages = []
+        # Fast path: a read usually completes exactly one frame, ending in
+        # ETX+LRC. Decoding it here leaves nothing for the general loop
+        if conn.read_pos == 0 and conn.write_pos > 3 and buffer[conn.write_pos - 2] == ETX[0]:
+            message, is_valid, end = Protocol.decode_frame(buffer, 0, None, conn.write_pos)
+            if is_valid:
+                messages.append(message)
+                conn.read_pos = end
+
+        # General case: pipelined or partial frames. A partial frame can
+        # only complete once its ETX arrives (in this read, or as the last
+        # byte of the previous one, waiting for the LRC), so a large frame
+        # trickling in isn't re-parsed on every read
+        if buffer.find(ETX, max(conn.read_pos, start - 1), conn.write_pos) != -1:
+            while conn.read_pos < conn.write_pos:
+                # Decode without key first (key resolved later in _process_message)
+                message, is_valid, end = Protocol.decode_frame(
+                    buffer, conn.read_pos, None, conn.write_pos
+                )
+
+                if not is_valid:
+                    break
+                messages.append(message)
+                conn.read_pos = end
+
+        if conn.read_pos == conn.write_pos:
+            conn.read_pos = conn.write_pos = 0
+        elif conn.write_pos == len(buffer) and conn.read_pos:
+            # Out of room: slide the partial frame to the front
+            remaining = conn.write_pos - conn.read_pos
+            buffer[:remaining] = buffer[conn.read_pos:conn.write_pos]
+            conn.read_pos, conn.write_pos = 0, remaining
+
+        if messages:
+            with conn.lock:
+                conn.pending.extend(messages)
+                if len(conn.pending) >= CENTRAL_MAX_PENDING and not conn.paused:
+                    # Backpressure: stop reading until the workers catch up
+                    conn.paused = True
+                    self._update_interest(conn)
+                submit = not conn.scheduled
+                conn.scheduled = True
+
+            if submit:
+                self.workers.submit(self._drain_client, conn)
+
+    def _drain_client(self, conn):
+        """Worker: process a connection's queued messages in arrival order"""
+        while True:
+            with conn.lock:
+                if not conn.pending:
+                    conn.scheduled = False
+                    closing = conn.closing
+                    if conn.corked:
+                        conn.corked = False
+                        self._write_outbuf(conn)
+                    break
+                message = conn.pending.popleft()
+                # More requests are queued behind this one (a pipelined
+                # REGISTER + QUERY, say): hold the replies and send them
+                # together in one write once the batch is done
+                if conn.pending:
+                    conn.corked = True
+                if conn.paused and len(conn.pending) <= CENTRAL_MAX_PENDING // 2:
+                    conn.paused = False
+                    self._update_interest(conn)
+
             try:
-                client_socket.close()
-            except:
-                pass
-            if client_id in self.active_connections:
-                del self.active_connections[client_id]
-            print(f"[EV_Central] Client disconnected: {client_id}")
+                self._process_message(message, conn.sock, conn.client_id)
+            except Exception as e:
+                log.warning("Error handling %s: %s", conn.client_id, e)
+                with conn.lock:
+                    conn.pending.clear()
+                    conn.closing = True
+                    self._update_interest(conn)
+
+        if closing:
+            self._close_client(conn)
+
+    def _disconnect_client(self, conn):
+        """Stop watching a socket whose peer went away"""
+        with conn.lock:
+            conn.closing = True
+            self._update_interest(conn)
+            busy = conn.scheduled
+
+        # A worker still holds queued messages; it closes the socket when done
+        if not busy:
+            self._close_client(conn)
+
+    def _close_client(self, conn):
+        """Release a client socket"""
+        self.connections.pop(conn.sock, None)
+        # Forget any entity mapped to it so later sends don't hit a dead fd
+        gone = []
+        with self.lock:
+            for sockets, entity_id in conn.entities:
+                # Skip IDs that re-registered on a newer connection since
+                if sockets.get(entity_id) is conn.sock:
+                    del sockets[entity_id]
+                    if sockets is self.entity_to_socket:
+                        gone.append(entity_id)
+        try:
+            conn.sock.close()
+        except:
+            pass
+        log.info("Client disconnected: %s", conn.client_id)
+
+        # A CP whose engine went away can't take drivers until it registers
+        # again; SO_KEEPALIVE gets us here even if the peer vanished silently
+        for entity_id in gone:
+            cp = self.charging_points.get(entity_id)
+            if cp is None:
+                continue
+            driver_id = None
+            with cp.lock:
+                # A session in progress can't go on without the engine
+                if cp.state == CP_STATES["SUPPLYING"] and cp.current_driver:
+                    driver_id = cp.current_driver
+                    total_kwh = cp.kwh_delivered
+                    total_amount = cp.amount_euro
+                    duration_seconds = int(time.time() - cp.session_start) if cp.session_start else 0
+                    cp.clear_session()
+                cp.state = CP_STATES["DISCONNECTED"]
+                self._track_availability(entity_id, cp)
+
+            if driver_id:
+                self._finalize_session(entity_id, driver_id, total_kwh, total_amount, duration_seconds)
+                log.warning("⚠️  Charging session at %s interrupted: CP disconnected", entity_id)
+
+                driver_sock = self.entity_to_socket.get(driver_id)
+                if driver_sock is not None:
+                    deny_msg = _cached_frame(MessageTypes.DENY, driver_id, entity_id, "CP_DISCONNECTED")
+                    if not self._send(driver_sock, deny_msg):
+                        log.warning("Failed to notify driver %s of disconnect", driver_id)
+                self._notify_monitor(entity_id, "DRIVER_STOP", entity_id, driver_id)
+            self._state_changed()
+
+    def _update_interest(self, conn):
+        """Re-register conn for the events it needs now; call with conn.lock held"""
+        events = 0
+        if not conn.closing:
+            if not conn.paused:
+                events |= selectors.EVENT_READ
+            if conn.outbuf and not conn.corked:
+                events |= selectors.EVENT_WRITE
+        if events == conn.events:
+            return
+
+        try:
+            if not events:
+                conn.sel.unregister(conn.sock)
+            elif not conn.events:
+                conn.sel.register(conn.sock, events, conn)
+            else:
+                conn.sel.modify(conn.sock, events, conn)
+        except (KeyError, ValueError, OSError):
+            pass
+        conn.events = events
+
+    def _send(self, sock, data):
+        """Send a frame without blocking, queueing what the socket can't take.
+
+        Returns True if the frame was sent or queued. Never raises: a peer
+        that already disconnected, or whose socket errors, just gets False
+        and the reactor's next read cleans it up. A peer that lets
+        CENTRAL_MAX_OUTBUF bytes pile up is dropped rather than stalling the
+        worker that is sending to it.
+        """
+        conn = self.connections.get(sock)
+        if conn is None:
+            # Closed and unregistered already; nobody left to deliver to
+            return False
+
+        with conn.lock:
+            if conn.closing:
+                return False
+            if not conn.outbuf and not conn.corked:
+                try:
+                    sent = sock.send(data)
+                except BlockingIOError:
+                    sent = 0
+                except OSError:
+                    # Peer is gone; the read side will see it and disconnect
+                    return False
+                if sent == len(data):
+                    return True
+                data = memoryview(data)[sent:]
+
+            conn.outbuf += data
+            overflow = len(conn.outbuf) > CENTRAL_MAX_OUTBUF
+            if not overflow:
+                self._update_interest(conn)
+
+        if overflow:
+            log.warning("⚠️  %s is not reading, dropping it", conn.client_id)
+            self._disconnect_client(conn)
+            return False
+        return True
+
+    def _flush_client(self, conn):
+        """Reactor: write queued bytes to a socket that became writable"""
+        with conn.lock:
+            self._write_outbuf(conn)
+
+    def _write_outbuf(self, conn):
+        """Send as much of outbuf as the socket takes; call with conn.lock held"""
+        if conn.outbuf:
+            try:
+                sent = conn.sock.send(conn.outbuf)
+            except BlockingIOError:
+                sent = 0
+            except OSError:
+                # Peer is gone; the read side will see it and disconnect
+                sent = len(conn.outbuf)
+            del conn.outbuf[:sent]
+        self._update_interest(conn)
 
     def _process_message(self, message, client_socket, client_id):
         """Process incoming message"""
@@ -215,11 +855,19 @@ class EVCentral:
         if not fields:
             return
 
-        msg_type = fields[0]
+        # Unknown types are dropped before the secret lookup and audit write
+        handler = self._handlers.get(fields[0])
+        if handler is None:
+            return
 
         encryption_key = None
         cp_id = None
 
+        # fields[1] is the CP or driver id every handler keys its lookups
+        # on; interned, those dict probes match on identity
+        if len(fields) > 1:
+            fields[1] = sys.intern(fields[1])
+
         # CP-related message → resolve encryption key
         if len(fields) > 1 and fields[1].startswith("CP"):
             cp_id = fields[1]
@@ -236,8 +884,6 @@ class EVCentral:
 
             # # Re-parse decrypted message
             # fields = Protocol.parse_message(decoded_message)
-            fields = Protocol.parse_message(message)
-            msg_type = fields[0]
 
             # Extract secret from last field (format: SECRET=xxxx)
             last_field = fields[-1]
@@ -245,40 +891,14 @@ class EVCentral:
 
             # Verify authentication
             if not self._is_authenticated(cp_id, secret):
-                print(f"[EV_Central] ❌ Authentication FAILED for {cp_id}")
+                log.warning("❌ Authentication FAILED for %s", cp_id)
                 log_auth(client_id, cp_id, success=False, reason="INVALID_SECRET")
                 return
 
             # Authentication successful
             log_auth(client_id, cp_id, success=True)
 
-        # Dispatch message
-        if msg_type == MessageTypes.REGISTER:
-            self._handle_register(fields, client_socket, client_id)
-
-        elif msg_type == MessageTypes.HEARTBEAT:
-            self._handle_heartbeat(fields, client_socket, client_id)
-
-        elif msg_type == MessageTypes.REQUEST_CHARGE:
-            self._handle_charge_request(fields, client_socket, client_id)
-
-        elif msg_type == MessageTypes.QUERY_AVAILABLE_CPS:
-            self._handle_query_available_cps(fields, client_socket, client_id)
-
-        elif msg_type == MessageTypes.SUPPLY_UPDATE:
-            self._handle_supply_update(fields, client_socket)
-
-        elif msg_type == MessageTypes.SUPPLY_END:
-            self._handle_supply_end(fields, client_socket)
-
-        elif msg_type == MessageTypes.END_CHARGE:
-            self._handle_end_charge(fields, client_socket, client_id)
-
-        elif msg_type == MessageTypes.FAULT:
-            self._handle_fault(fields, client_socket)
-
-        elif msg_type == MessageTypes.RECOVERY:
-            self._handle_recovery(fields, client_socket)
+        handler(fields, client_socket, client_id)
 
     def _handle_register(self, fields, client_socket, client_id):
         """Handle CP or Driver registration"""
@@ -286,7 +906,8 @@ class EVCentral:
             return
 
         entity_type = fields[1]
-        entity_id = fields[2]
+        # Becomes a key in charging_points/drivers/entity_to_socket
+        entity_id = sys.intern(fields[2])
 
         if entity_type == "CP":
             lat = fields[3] if len(fields) > 3 else "0"
@@ -295,234 +916,303 @@ class EVCentral:
 
             secret = fields[6] if len(fields) > 6 else None
 
-            with self.lock:
-                self.charging_points[entity_id] = {
-                    "state": CP_STATES["ACTIVATED"],
-                    "location": (lat, lon),
-                    "price_per_kwh": price,
-                    "connected_at": datetime.now().isoformat(),
-                    "current_driver": None,
-                    "kwh_delivered": 0,
-                    "amount_euro": 0,
-                    "session_start": None,
-                    "charging_complete": False
-                }
-
-                self.entity_to_socket[entity_id] = client_socket
-
-                if secret:
-                    self.storage.save_cp_secret(entity_id, secret)
-                    log_auth(client_id, entity_id, success=True)
-
-                    # Store encryption key for this CP
-                    self.cp_encryption_keys[entity_id] = EncryptionManager.generate_key(secret)
-                    self.kafka.set_encryption_key(self.cp_encryption_keys[entity_id])
-
-            self.storage.save_cp(entity_id, lat, lon, price, CP_STATES["ACTIVATED"])
-
-            print(f"[EV_Central] ✅ CP Registered: {entity_id} at ({lat}, {lon}) - Saved to file")
-
-            self.kafka.publish_event("system_events", "CP_REGISTERED", {
-                "cp_id": entity_id,
-                "location": (lat, lon),
-                "price": price
-            })
-
-            response = Protocol.encode(
-                Protocol.build_message(MessageTypes.ACKNOWLEDGE, entity_id, "OK"),
-                self.cp_encryption_keys.get(entity_id)
+            cp = ChargingPoint(
+                state=CP_STATES["ACTIVATED"],
+                location=(lat, lon),
+                price_per_kwh=price,
+                connected_at=time.time()
             )
 
-            client_socket.send(response)
+            with self.lock:
+                replaced = self.charging_points.get(entity_id)
+                self.charging_points[entity_id] = cp
+                self._snapshot_cps()
+                self._map_entity(self.entity_to_socket, entity_id, client_socket)
+            if replaced is not None:
+                with replaced.lock:
+                    self._count_state(replaced, None)
+            with cp.lock:
+                # A re-registration may change location or price
+                self._track_availability(entity_id, cp, refresh=True)
+            self._state_changed()
+
+            if secret:
+                self.cp_secrets[entity_id] = secret
+                self._store("save_cp_secret", entity_id, secret)
+                log_auth(client_id, entity_id, success=True)
+
+                # Store encryption key for this CP
+                key = EncryptionManager.generate_key(secret)
+                self.cp_encryption_keys[entity_id] = key
+                self.kafka.set_encryption_key(key)
+
+            self._store("save_cp", entity_id, lat, lon, price, CP_STATES["ACTIVATED"])
+
+            log.info("✅ CP Registered: %s at (%s, %s) - Saved to file", entity_id, lat, lon)
+
+            self._publish("system_events", "CP_REGISTERED",
+                          CPRegistered(entity_id, (lat, lon), price))
+
+            response = _encode(self.cp_encryption_keys.get(entity_id),
+                               MessageTypes.ACKNOWLEDGE, entity_id, "OK")
+
+            self._send(client_socket, response)
 
         elif entity_type == "DRIVER":
+            with self.drivers_lock:
+                replaced = self.drivers.get(entity_id)
+                self.drivers[entity_id] = Driver()
+                self._driver_snapshot = tuple(self.drivers.items())
+            if replaced is not None:
+                with replaced.lock:
+                    current_cp = replaced.current_cp
+                    self._set_driver_status(replaced, "IDLE")
+                # Reconnected mid-session: the CP's SUPPLY_UPDATEs follow
+                # the driver to its new socket
+                cp = self.charging_points.get(current_cp) if current_cp else None
+                if cp is not None:
+                    with cp.lock:
+                        if cp.current_driver == entity_id:
+                            cp.driver_socket = client_socket
             with self.lock:
-                self.drivers[entity_id] = {
-                    "status": "IDLE",
-                    "current_cp": None,
-                    "charge_amount": 0
-                }
+                self._map_entity(self.entity_to_socket, entity_id, client_socket)
+            self._state_changed()
 
-                self.entity_to_socket[entity_id] = client_socket
-                print(f"[EV_Central] 🔑 Mapped driver {entity_id} to socket")
+            log.info("🔑 Mapped driver %s to socket", entity_id)
 
-            self.storage.save_driver(entity_id, "IDLE")
+            self._store("save_driver", entity_id, "IDLE")
 
-            print(f"[EV_Central] ✅ Driver Registered: {entity_id} - Saved to file")
+            log.info("✅ Driver Registered: %s - Saved to file", entity_id)
 
-            response = Protocol.encode(
-                Protocol.build_message(MessageTypes.ACKNOWLEDGE, entity_id, "OK"),
-                None
-            )
+            response = _cached_frame(MessageTypes.ACKNOWLEDGE, entity_id, "OK")
 
 
-            client_socket.send(response)
+            self._send(client_socket, response)
 
         elif entity_type == "MONITOR":
-            monitor_cp_id = fields[3] if len(fields) > 3 else None
+            monitor_cp_id = sys.intern(fields[3]) if len(fields) > 3 else None
 
             if monitor_cp_id:
                 with self.lock:
-                    self.monitors[monitor_cp_id] = client_socket
+                    self._map_entity(self.monitors, monitor_cp_id, client_socket)
 
-                print(f"[EV_Central] ✅ Monitor Registered for {monitor_cp_id}")
+                log.info("✅ Monitor Registered for %s", monitor_cp_id)
 
-                response = Protocol.encode(
-                    Protocol.build_message(MessageTypes.ACKNOWLEDGE, monitor_cp_id, "MONITOR_OK"),
-                    self.cp_encryption_keys.get(monitor_cp_id)
-                )
+                response = _encode(self.cp_encryption_keys.get(monitor_cp_id),
+                                   MessageTypes.ACKNOWLEDGE, monitor_cp_id, "MONITOR_OK")
+
+
+                self._send(client_socket, response)
 
+    def _snapshot_cps(self):
+        """Publish a fresh charging_points snapshot; call with self.lock held"""
+        self._cp_snapshot = tuple(self.charging_points.items())
 
-                client_socket.send(response)
+    def _map_entity(self, sockets, entity_id, client_socket):
+        """Point sockets[entity_id] at client_socket; call with self.lock held
+
+        The connection remembers the entry so _close_client can drop it
+        without scanning every registered entity.
+        """
+        sockets[entity_id] = client_socket
+        conn = self.connections.get(client_socket)
+        if conn is not None and not any(m is sockets and e == entity_id for m, e in conn.entities):
+            conn.entities.append((sockets, entity_id))
 
     def _handle_charge_request(self, fields, client_socket, client_id):
         """Handle driver charging request"""
         if len(fields) < 4:
-            print(f"[EV_Central] ⚠️  Invalid REQUEST_CHARGE: {fields}")
+            log.warning("⚠️  Invalid REQUEST_CHARGE: %s", fields)
             return
 
         driver_id = fields[1]
-        cp_id = fields[2]
+        cp_id = sys.intern(fields[2])
         kwh_needed = float(fields[3])
 
-        print(f"[EV_Central] 🔌 {driver_id} requesting {kwh_needed} kWh at {cp_id}")
+        log.info("🔌 %s requesting %s kWh at %s", driver_id, kwh_needed, cp_id)
 
-        with self.lock:
-            if cp_id not in self.charging_points:
-                response = Protocol.encode(
-                    Protocol.build_message(MessageTypes.DENY, driver_id, cp_id, "CP_NOT_FOUND"),
-                    None
-                )
+        # Checked before the CP is touched: an unknown driver must not leave
+        # the CP reserved
+        driver = self.drivers.get(driver_id)
+        if driver is None:
+            response = _cached_frame(MessageTypes.DENY, driver_id, cp_id, "DRIVER_NOT_REGISTERED")
+            self._send(client_socket, response)
+            log.warning("❌ Denied: driver %s not registered", driver_id)
+            return
 
+        cp = self.charging_points.get(cp_id)
 
-                client_socket.send(response)
-                print(f"[EV_Central] ❌ Denied: CP not found")
-                return
+        if cp is None:
+            response = _cached_frame(MessageTypes.DENY, driver_id, cp_id, "CP_NOT_FOUND")
 
-            cp = self.charging_points[cp_id]
 
-            if cp["state"] != CP_STATES["ACTIVATED"] or cp["current_driver"] is not None:
-                reason = f"CP_STATE_{cp['state']}" if cp["state"] != CP_STATES["ACTIVATED"] else "CP_ALREADY_IN_USE"
-                response = Protocol.encode(
-                    Protocol.build_message(MessageTypes.DENY, driver_id, cp_id, reason),
-                    None
-                )
+            self._send(client_socket, response)
+            log.warning("❌ Denied: CP not found")
+            return
 
-                client_socket.send(response)
-                print(f"[EV_Central] ❌ Denied: {reason}")
-                return
+        reason = None
+        with cp.lock:
+            if cp.state != CP_STATES["ACTIVATED"] or cp.current_driver is not None:
+                reason = f"CP_STATE_{cp.state}" if cp.state != CP_STATES["ACTIVATED"] else "CP_ALREADY_IN_USE"
+            else:
+                # Authorization granted
+                cp.state = CP_STATES["SUPPLYING"]
+                cp.current_driver = driver_id
+                # Captured once so SUPPLY_UPDATE forwarding needs no lookup
+                cp.driver_socket = client_socket
+                cp.session_start = time.time()
+                cp.kwh_delivered = 0
+                cp.amount_euro = 0
+                cp.kwh_needed = kwh_needed
+                cp.charging_complete = False
+                self._track_availability(cp_id, cp)
+                price_per_kwh = cp.price_per_kwh
+
+        if reason is not None:
+            response = _cached_frame(MessageTypes.DENY, driver_id, cp_id, reason)
+
+            self._send(client_socket, response)
+            log.warning("❌ Denied: %s", reason)
+            return
 
-            # Authorization granted
-            cp["state"] = CP_STATES["SUPPLYING"]
-            cp["current_driver"] = driver_id
-            cp["session_start"] = time.time()
-            cp["kwh_delivered"] = 0
-            cp["amount_euro"] = 0
-            cp["kwh_needed"] = kwh_needed
-            cp["charging_complete"] = False
-            
-            self.drivers[driver_id]["status"] = "CHARGING"
-            self.drivers[driver_id]["current_cp"] = cp_id
+        with driver.lock:
+            self._set_driver_status(driver, "CHARGING")
+            driver.current_cp = cp_id
+        self._state_changed()
 
-        print(f"[EV_Central] ✅ Charge authorized: Driver {driver_id} → CP {cp_id}")
+        log.info("✅ Charge authorized: Driver %s → CP %s", driver_id, cp_id)
 
         # Send AUTHORIZE to driver
         response = Protocol.encode(
-            Protocol.build_message(MessageTypes.AUTHORIZE, driver_id, cp_id, kwh_needed, cp["price_per_kwh"]),
+            Protocol.build_message(MessageTypes.AUTHORIZE, driver_id, cp_id, kwh_needed, price_per_kwh),
             None
         )
 
-        try:
-            client_socket.send(response)
-            print(f"[EV_Central] 📤 Sent AUTHORIZE to driver {driver_id}")
-        except Exception as e:
-            print(f"[EV_Central] ⚠️  Failed to send AUTHORIZE to driver: {e}")
+        if self._send(client_socket, response):
+            log.debug("📤 Sent AUTHORIZE to driver %s", driver_id)
+        else:
+            log.warning("⚠️  Failed to send AUTHORIZE to driver %s", driver_id)
 
         # Send AUTHORIZE to CP Engine
-        if cp_id in self.entity_to_socket:
+        cp_sock = self.entity_to_socket.get(cp_id)
+        if cp_sock is not None:
             cp_auth_msg = Protocol.encode(
                 Protocol.build_message(MessageTypes.AUTHORIZE, driver_id, cp_id, kwh_needed),
                 self.cp_encryption_keys.get(cp_id)
             )
 
-            try:
-                self.entity_to_socket[cp_id].send(cp_auth_msg)
-                print(f"[EV_Central] 📤 Sent AUTHORIZE to CP {cp_id}")
-            except Exception as e:
-                print(f"[EV_Central] ⚠️  Failed to send AUTHORIZE to CP: {e}")
+            if self._send(cp_sock, cp_auth_msg):
+                log.debug("📤 Sent AUTHORIZE to CP %s", cp_id)
+            else:
+                log.warning("⚠️  Failed to send AUTHORIZE to CP %s", cp_id)
 
         # Notify monitor
-        if cp_id in self.monitors:
-            try:
-                monitor_notify = Protocol.encode(
-                    Protocol.build_message("DRIVER_START", cp_id, driver_id),
-                    self.cp_encryption_keys.get(cp_id)
-                )
+        self._notify_monitor(cp_id, "DRIVER_START", cp_id, driver_id)
 
-                self.monitors[cp_id].send(monitor_notify)
-                print(f"[EV_Central] 📤 Notified monitor: {driver_id} started at {cp_id}")
-            except Exception as e:
-                print(f"[EV_Central] Failed to notify monitor: {e}")
-
-        self.kafka.publish_event("charging_logs", "CHARGE_AUTHORIZED", {
-            "driver_id": driver_id,
-            "cp_id": cp_id,
-            "kwh_needed": kwh_needed
-        })
+        self._publish("charging_logs", "CHARGE_AUTHORIZED",
+                      ChargeAuthorized(driver_id, cp_id, kwh_needed))
 
         log_charge(client_id, cp_id, driver_id, "CHARGE_START", kwh=kwh_needed)
 
-    def _handle_supply_update(self, fields, client_socket):
+    def _handle_supply_update(self, fields, client_socket, client_id):
         """Handle real-time supply updates from CP"""
         if len(fields) < 4:
-            print(f"[EV_Central] ⚠️  Invalid SUPPLY_UPDATE: {fields}")
+            log.warning("⚠️  Invalid SUPPLY_UPDATE: %s", fields)
             return
 
         cp_id = fields[1]
         kwh_increment = float(fields[2])
         amount = float(fields[3])
 
-        driver_id = None
-        with self.lock:
-            if cp_id in self.charging_points:
-                cp = self.charging_points[cp_id]
-                cp["kwh_delivered"] += kwh_increment
-                cp["amount_euro"] = amount
-                driver_id = cp["current_driver"]
-                
-                # Check if 100% reached
-                if cp["kwh_delivered"] >= cp.get("kwh_needed", 10):
-                    if not cp.get("charging_complete", False):
-                        cp["charging_complete"] = True
-                        print(f"\n[EV_Central] 🔋 {driver_id} finished charging at {cp_id}, waiting for driver to unplug\n")
-                        
-                        # Notify monitor of completion
-                        if cp_id in self.monitors:
-                            try:
-                                complete_msg = Protocol.encode(
-                                    Protocol.build_message("CHARGING_COMPLETE", cp_id, driver_id),
-                                    self.cp_encryption_keys.get(cp_id)
-                                )
-
-                                self.monitors[cp_id].send(complete_msg)
-                            except Exception as e:
-                                print(f"[EV_Central] Failed to notify monitor of completion: {e}")
-                
-                print(f"[EV_Central] 📊 CP {cp_id}: {cp['kwh_delivered']:.3f} kWh, {amount:.2f}€")
+        cp = self.charging_points.get(cp_id)
 
-        # Forward update to driver
-        if driver_id and driver_id in self.entity_to_socket:
-            try:
-                update_msg = Protocol.encode(
-                    Protocol.build_message(MessageTypes.SUPPLY_UPDATE, cp_id, kwh_increment, amount),
-                    None
-                )
+        if cp is None:
+            return
 
-                self.entity_to_socket[driver_id].send(update_msg)
-            except Exception as e:
-                print(f"[EV_Central] Failed to forward update to {driver_id}: {e}")
+        with cp.lock:
+            kwh_delivered = cp.kwh_delivered + kwh_increment
+            cp.kwh_delivered = kwh_delivered
+            cp.amount_euro = amount
+            driver_id = cp.current_driver
+            driver_sock = cp.driver_socket
+
+            # Check if 100% reached (kwh_needed is always set on authorize)
+            just_completed = not cp.charging_complete and kwh_delivered >= cp.kwh_needed
+            if just_completed:
+                cp.charging_complete = True
+        self._state_changed()
+
+        if just_completed:
+            log.info("🔋 %s finished charging at %s, waiting for driver to unplug", driver_id, cp_id)
+
+            # Notify monitor of completion
+            self._notify_monitor(cp_id, "CHARGING_COMPLETE", cp_id, driver_id)
+
+        log.debug("📊 CP %s: %.3f kWh, %.2f€", cp_id, kwh_delivered, amount)
+
+        # Forward update to driver: reuse the CP's own fields verbatim rather
+        # than re-formatting the floats, but drop the trailing SECRET field.
+        # Only the newest update per driver is kept until the forwarder runs
+        if driver_sock is not None:
+            with self._updates_cv:
+                self._pending_updates[driver_id] = (driver_sock, '#'.join(fields[:4]))
+                self._updates_cv.notify()
+
+    def _update_forwarder(self):
+        """Send drivers their latest SUPPLY_UPDATE and TICKETs, and monitors their queued frames"""
+        while self.running:
+            with self._updates_cv:
+                while not (self._pending_updates or self._pending_monitor or self._pending_tickets) \
+                        and self.running:
+                    self._updates_cv.wait()
+                pending = self._pending_updates
+                self._pending_updates = {}
+                monitor_frames = self._pending_monitor
+                self._pending_monitor = {}
+                tickets = self._pending_tickets
+                self._pending_tickets = []
+
+            # Frames that piled up for one monitor go out in a single write
+            for cp_id, frames in monitor_frames.items():
+                monitor_sock = self.monitors.get(cp_id)
+                if monitor_sock is None:
+                    continue
+                if self._send(monitor_sock, b''.join(frames)):
+                    log.debug("📤 Notified monitor of %s (%d frame(s))", cp_id, len(frames))
+
+            for driver_id, (driver_sock, update) in pending.items():
+                frame = Protocol.encode(update, None)
+                if not self._send(driver_sock, frame):
+                    # The driver may have reconnected since the update was
+                    # queued: retry on the socket it is registered on now
+                    current_sock = self.entity_to_socket.get(driver_id)
+                    if current_sock is None or current_sock is driver_sock \
+                            or not self._send(current_sock, frame):
+                        log.debug("Dropped SUPPLY_UPDATE for %s", driver_id)
+
+            # After the updates: a session's last SUPPLY_UPDATE was either
+            # sent just above or dropped by _drop_pending_update, never later
+            for driver_id, driver_sock, ticket in tickets:
+                if self._send(driver_sock, ticket):
+                    log.debug("📤 Sent TICKET to driver %s", driver_id)
+                else:
+                    log.warning("Failed to send ticket to %s", driver_id)
+
+    def _notify_monitor(self, cp_id, *fields):
+        """Queue a notice for the CP's monitor, if one is registered"""
+        if cp_id not in self.monitors:
+            return
+        frame = _encode(self.cp_encryption_keys.get(cp_id), *fields)
+        with self._updates_cv:
+            self._pending_monitor.setdefault(cp_id, []).append(frame)
+            self._updates_cv.notify()
+
+    def _drop_pending_update(self, driver_id):
+        """Discard an unsent SUPPLY_UPDATE once the driver's session is over"""
+        with self._updates_cv:
+            self._pending_updates.pop(driver_id, None)
 
-    def _handle_supply_end(self, fields, client_socket):
+    def _handle_supply_end(self, fields, client_socket, client_id):
         """Handle supply completion from CP"""
         if len(fields) < 5:
             return
@@ -534,63 +1224,71 @@ class EVCentral:
 
         duration_seconds = 0
         
-        with self.lock:
-            if cp_id in self.charging_points:
-                cp = self.charging_points[cp_id]
-                
-                if cp["session_start"]:
-                    duration_seconds = int(time.time() - cp["session_start"])
-                
-                cp["state"] = CP_STATES["ACTIVATED"]
-                cp["current_driver"] = None
-                cp["kwh_delivered"] = 0
-                cp["amount_euro"] = 0
-                cp["session_start"] = None
-                cp["charging_complete"] = False
+        cp = self.charging_points.get(cp_id)
 
-            if driver_id in self.drivers:
-                self.drivers[driver_id]["status"] = "IDLE"
-                self.drivers[driver_id]["current_cp"] = None
-
-        self.storage.save_charging_session(cp_id, driver_id, total_kwh, total_amount, duration_seconds)
-        self.storage.update_driver_stats(driver_id, total_amount)
+        if cp is not None:
+            with cp.lock:
+                if cp.session_start:
+                    duration_seconds = int(time.time() - cp.session_start)
+                
+                cp.state = CP_STATES["ACTIVATED"]
+                cp.clear_session()
+                self._track_availability(cp_id, cp)
 
-        print(f"\n[EV_Central] ✅ {driver_id} unplugged from {cp_id}")
-        print(f"[EV_Central]    → {total_kwh:.2f} kWh, {total_amount:.2f}€, {duration_seconds}s")
-        print(f"[EV_Central]    → CP {cp_id} now ACTIVATED\n")
+        self._finalize_session(cp_id, driver_id, total_kwh, total_amount, duration_seconds)
 
-        if driver_id in self.entity_to_socket:
-            try:
-                ticket_msg = Protocol.encode(
-                    Protocol.build_message(MessageTypes.TICKET, cp_id, total_kwh, total_amount),
-                    None
-                )
+        log.info("✅ %s unplugged from %s", driver_id, cp_id)
+        log.info("   → %.2f kWh, %.2f€, %ss", total_kwh, total_amount, duration_seconds)
+        log.info("   → CP %s now ACTIVATED", cp_id)
 
-                self.entity_to_socket[driver_id].send(ticket_msg)
-                print(f"[EV_Central] 📤 Sent TICKET to driver {driver_id}")
-            except Exception as e:
-                print(f"[EV_Central] Failed to send ticket to {driver_id}: {e}")
+        self._send_ticket(driver_id, cp_id, total_kwh, total_amount)
+        self._notify_monitor(cp_id, "DRIVER_STOP", cp_id, driver_id)
 
-        if cp_id in self.monitors:
-            try:
-                monitor_notify = Protocol.encode(
-                    Protocol.build_message("DRIVER_STOP", cp_id, driver_id),
-                    self.cp_encryption_keys.get(cp_id)
-                )
+        self._publish("charging_logs", "CHARGE_COMPLETED",
+                      ChargeCompleted(cp_id, driver_id, total_kwh, total_amount))
 
-                self.monitors[cp_id].send(monitor_notify)
-                print(f"[EV_Central] 📤 Notified monitor: {driver_id} unplugged from {cp_id}")
-            except Exception as e:
-                print(f"[EV_Central] Failed to notify monitor: {e}")
+        log_charge(client_id, cp_id, driver_id, "CHARGE_END", kwh=total_kwh, amount=total_amount)
 
-        self.kafka.publish_event("charging_logs", "CHARGE_COMPLETED", {
+    def _finalize_session(self, cp_id, driver_id, total_kwh, total_amount, duration_seconds):
+        """Book a finished session and return its driver to IDLE"""
+        session = {
+            "timestamp": datetime.now().isoformat(),
             "cp_id": cp_id,
             "driver_id": driver_id,
-            "total_kwh": total_kwh,
-            "total_amount": total_amount
-        })
-
-        log_charge(client_id, cp_id, driver_id, "CHARGE_END", kwh=total_kwh, amount=total_amount)
+            "kwh_delivered": total_kwh,
+            "total_amount": total_amount,
+            "duration_seconds": duration_seconds
+        }
+        self._history.append(session)
+        self._store("save_charging_session", cp_id, driver_id, total_kwh, total_amount, duration_seconds,
+                    session["timestamp"])
+        self._store("update_driver_stats", driver_id, total_amount)
+
+        driver = self.drivers.get(driver_id)
+        if driver is not None:
+            with driver.lock:
+                self._set_driver_status(driver, "IDLE")
+                driver.current_cp = None
+        self._drop_pending_update(driver_id)
+        self._state_changed()
+
+    def _send_ticket(self, driver_id, cp_id, total_kwh, total_amount):
+        """Queue a session's TICKET for its driver; True if the driver is connected
+
+        Sent by _update_forwarder, so it can't overtake a SUPPLY_UPDATE the
+        forwarder already picked up. Call after _finalize_session.
+        """
+        driver_sock = self.entity_to_socket.get(driver_id)
+        if driver_sock is None:
+            return False
+        ticket = Protocol.encode(
+            Protocol.build_message(MessageTypes.TICKET, cp_id, total_kwh, total_amount),
+            None
+        )
+        with self._updates_cv:
+            self._pending_tickets.append((driver_id, driver_sock, ticket))
+            self._updates_cv.notify()
+        return True
 
     def _handle_end_charge(self, fields, client_socket, client_id):
         """Handle manual end charge from driver"""
@@ -600,90 +1298,53 @@ class EVCentral:
         driver_id = fields[1]
         cp_id = fields[2]
 
-        print(f"[EV_Central] 🔌 Driver {driver_id} manually ending charge at {cp_id}")
+        log.info("🔌 Driver %s manually ending charge at %s", driver_id, cp_id)
 
         total_kwh = 0
         total_amount = 0
         duration_seconds = 0
 
-        with self.lock:
-            if cp_id not in self.charging_points:
-                print(f"[EV_Central] ❌ CP {cp_id} not found")
-                return
-            
-            cp = self.charging_points[cp_id]
-            
-            if cp["current_driver"] != driver_id:
-                print(f"[EV_Central] ❌ Driver {driver_id} not charging at {cp_id}")
+        cp = self.charging_points.get(cp_id)
+
+        if cp is None:
+            log.warning("❌ CP %s not found", cp_id)
+            return
+
+        with cp.lock:
+            if cp.current_driver != driver_id:
+                log.warning("❌ Driver %s not charging at %s", driver_id, cp_id)
                 return
 
-            duration_seconds = int(time.time() - cp["session_start"]) if cp["session_start"] else 0
+            duration_seconds = int(time.time() - cp.session_start) if cp.session_start else 0
             total_seconds = 14.0
-            kwh_needed = cp.get("kwh_needed", 10)
+            kwh_needed = cp.kwh_needed
             total_kwh = min(kwh_needed, (duration_seconds / total_seconds) * kwh_needed)
-            total_amount = round(total_kwh * cp["price_per_kwh"], 2)
+            total_amount = round(total_kwh * cp.price_per_kwh, 2)
 
-            cp["state"] = CP_STATES["ACTIVATED"]
-            cp["current_driver"] = None
-            cp["kwh_delivered"] = 0
-            cp["amount_euro"] = 0
-            cp["session_start"] = None
-            cp["charging_complete"] = False
+            cp.state = CP_STATES["ACTIVATED"]
+            cp.clear_session()
+            self._track_availability(cp_id, cp)
 
-            if driver_id in self.drivers:
-                self.drivers[driver_id]["status"] = "IDLE"
-                self.drivers[driver_id]["current_cp"] = None
+        self._finalize_session(cp_id, driver_id, total_kwh, total_amount, duration_seconds)
 
-        self.storage.save_charging_session(cp_id, driver_id, total_kwh, total_amount, duration_seconds)
-        self.storage.update_driver_stats(driver_id, total_amount)
+        log.info("✅ %s unplugged from %s", driver_id, cp_id)
+        log.info("   → %.2f kWh, %.2f€, %ss", total_kwh, total_amount, duration_seconds)
+        log.info("   → CP %s now ACTIVATED", cp_id)
 
-        print(f"\n[EV_Central] ✅ {driver_id} unplugged from {cp_id}")
-        print(f"[EV_Central]    → {total_kwh:.2f} kWh, {total_amount:.2f}€, {duration_seconds}s")
-        print(f"[EV_Central]    → CP {cp_id} now ACTIVATED\n")
+        cp_sock = self.entity_to_socket.get(cp_id)
+        if cp_sock is not None:
+            end_supply_msg = _encode(self.cp_encryption_keys.get(cp_id), MessageTypes.END_SUPPLY, cp_id)
 
-        if cp_id in self.entity_to_socket:
-            try:
-                end_supply_msg = Protocol.encode(
-                    Protocol.build_message(MessageTypes.END_SUPPLY, cp_id),
-                    self.cp_encryption_keys.get(cp_id)
-                )
+            if self._send(cp_sock, end_supply_msg):
+                log.debug("📤 Sent END_SUPPLY to CP %s", cp_id)
+            else:
+                log.warning("⚠️  Failed to send END_SUPPLY to %s", cp_id)
 
-                self.entity_to_socket[cp_id].send(end_supply_msg)
-                print(f"[EV_Central] 📤 Sent END_SUPPLY to CP {cp_id}")
-            except Exception as e:
-                print(f"[EV_Central] ⚠️  Failed to send END_SUPPLY to {cp_id}: {e}")
+        self._send_ticket(driver_id, cp_id, total_kwh, total_amount)
+        self._notify_monitor(cp_id, "DRIVER_STOP", cp_id, driver_id)
 
-        if driver_id in self.entity_to_socket:
-            try:
-                ticket_msg = Protocol.encode(
-                    Protocol.build_message(MessageTypes.TICKET, cp_id, total_kwh, total_amount),
-                    None
-                )
-
-                self.entity_to_socket[driver_id].send(ticket_msg)
-                print(f"[EV_Central] 📤 Sent ticket to driver {driver_id}")
-            except Exception as e:
-                print(f"[EV_Central] ⚠️  Failed to send ticket to {driver_id}: {e}")
-
-        if cp_id in self.monitors:
-            try:
-                monitor_notify = Protocol.encode(
-                    Protocol.build_message("DRIVER_STOP", cp_id, driver_id),
-                    self.cp_encryption_keys.get(cp_id)
-                )
-
-                self.monitors[cp_id].send(monitor_notify)
-                print(f"[EV_Central] 📤 Notified monitor: {driver_id} unplugged from {cp_id}")
-            except Exception as e:
-                print(f"[EV_Central] Failed to notify monitor: {e}")
-
-        self.kafka.publish_event("charging_logs", "CHARGE_MANUALLY_ENDED", {
-            "cp_id": cp_id,
-            "driver_id": driver_id,
-            "total_kwh": total_kwh,
-            "total_amount": total_amount,
-            "duration_seconds": duration_seconds
-        })
+        self._publish("charging_logs", "CHARGE_MANUALLY_ENDED",
+                      ChargeManuallyEnded(cp_id, driver_id, total_kwh, total_amount, duration_seconds))
 
     def _handle_heartbeat(self, fields, client_socket, client_id):
         """Handle heartbeat from CP"""
@@ -693,12 +1354,22 @@ class EVCentral:
         cp_id = fields[1]
         state = fields[2]
 
-        with self.lock:
-            if cp_id in self.charging_points:
-                if self.charging_points[cp_id]["state"] != CP_STATES["SUPPLYING"]:
-                    self.charging_points[cp_id]["state"] = state
+        # Heartbeats arrive every second per CP and almost never change
+        # anything: check without locks first (a single dict read and
+        # attribute read are atomic) and only lock to apply a change
+        cp = self.charging_points.get(cp_id)
+        if cp is None or cp.state == state or cp.state == CP_STATES["SUPPLYING"]:
+            return
+
+        with cp.lock:
+            changed = cp.state != state and cp.state != CP_STATES["SUPPLYING"]
+            if changed:
+                cp.state = state
+                self._track_availability(cp_id, cp)
+        if changed:
+            self._state_changed()
 
-    def _handle_fault(self, fields, client_socket):
+    def _handle_fault(self, fields, client_socket, client_id):
         """Handle fault notification from CP monitor"""
         if len(fields) < 2:
             return
@@ -708,67 +1379,110 @@ class EVCentral:
         driver_id = None
         was_supplying = False
 
-        with self.lock:
-            if cp_id in self.charging_points:
-                cp = self.charging_points[cp_id]
-                was_supplying = (cp["state"] == CP_STATES["SUPPLYING"])
-                driver_id = cp["current_driver"]
+        cp = self.charging_points.get(cp_id)
+
+        if cp is not None:
+            with cp.lock:
+                was_supplying = (cp.state == CP_STATES["SUPPLYING"])
+                driver_id = cp.current_driver
                 
-                cp["state"] = CP_STATES["OUT_OF_ORDER"]
+                cp.state = CP_STATES["OUT_OF_ORDER"]
+                self._track_availability(cp_id, cp)
                 
                 if was_supplying and driver_id:
-                    total_kwh = cp["kwh_delivered"]
-                    total_amount = cp["amount_euro"]
-                    duration_seconds = int(time.time() - cp["session_start"]) if cp["session_start"] else 0
+                    total_kwh = cp.kwh_delivered
+                    total_amount = cp.amount_euro
+                    duration_seconds = int(time.time() - cp.session_start) if cp.session_start else 0
                     
-                    self.storage.save_charging_session(cp_id, driver_id, total_kwh, total_amount, duration_seconds)
-                    self.storage.update_driver_stats(driver_id, total_amount)
-                    
-                    cp["current_driver"] = None
-                    cp["kwh_delivered"] = 0
-                    cp["amount_euro"] = 0
-                    cp["session_start"] = None
-                    cp["charging_complete"] = False
-                    
-                    if driver_id in self.drivers:
-                        self.drivers[driver_id]["status"] = "IDLE"
-                        self.drivers[driver_id]["current_cp"] = None
+                    cp.clear_session()
 
-        print(f"[EV_Central] ⚠️ FAULT reported for CP {cp_id}")
+        if was_supplying and driver_id:
+            self._finalize_session(cp_id, driver_id, total_kwh, total_amount, duration_seconds)
+        self._state_changed()
+
+        log.warning("⚠️ FAULT reported for CP %s", cp_id)
         
         if was_supplying and driver_id:
-            print(f"[EV_Central] ⚠️  Charging session interrupted for driver {driver_id}")
+            log.warning("⚠️  Charging session interrupted for driver %s", driver_id)
             
-            if driver_id in self.entity_to_socket:
-                try:
-                    fault_msg = Protocol.encode(
-                        Protocol.build_message(MessageTypes.DENY, driver_id, cp_id, "CP_FAULT_EMERGENCY_STOP"),
-                        None
-                    )
+            driver_sock = self.entity_to_socket.get(driver_id)
+            if driver_sock is not None:
+                fault_msg = _cached_frame(MessageTypes.DENY, driver_id, cp_id, "CP_FAULT_EMERGENCY_STOP")
 
-                    self.entity_to_socket[driver_id].send(fault_msg)
-                except Exception as e:
-                    print(f"[EV_Central] Failed to notify driver of fault: {e}")
+                if not self._send(driver_sock, fault_msg):
+                    log.warning("Failed to notify driver %s of fault", driver_id)
         
-        self.kafka.publish_event("system_events", "CP_FAULT", {"cp_id": cp_id})
+        self._publish("system_events", "CP_FAULT", CPStatus(cp_id))
         log_fault(client_id, cp_id, "CP_FAULT", "Health check failed")
 
 
-    def _handle_recovery(self, fields, client_socket):
+    def _handle_recovery(self, fields, client_socket, client_id):
         """Handle recovery notification from CP monitor"""
         if len(fields) < 2:
             return
 
         cp_id = fields[1]
 
-        with self.lock:
-            if cp_id in self.charging_points:
-                self.charging_points[cp_id]["state"] = CP_STATES["ACTIVATED"]
+        cp = self.charging_points.get(cp_id)
+
+        if cp is not None:
+            with cp.lock:
+                cp.state = CP_STATES["ACTIVATED"]
+                self._track_availability(cp_id, cp)
+            self._state_changed()
 
-        print(f"[EV_Central] ✅ CP {cp_id} recovered")
-        self.kafka.publish_event("system_events", "CP_RECOVERED", {"cp_id": cp_id})
+        log.info("✅ CP %s recovered", cp_id)
+        self._publish("system_events", "CP_RECOVERED", CPStatus(cp_id))
         log_fault("SYSTEM", cp_id, "CP_RECOVERY", "System restored")
 
+    def _track_availability(self, cp_id, cp, refresh=False):
+        """Sync cp_id's entry in _available_cps; call with cp.lock held"""
+        self._count_state(cp, cp.state)
+        segment = None
+        if cp.state == CP_STATES["ACTIVATED"] and cp.current_driver is None:
+            segment = Protocol.build_message(cp_id, cp.location[0], cp.location[1], cp.price_per_kwh)
+        self._set_available(cp_id, segment, refresh)
+
+    def _count_state(self, cp, state):
+        """Move cp in _state_counts from its last counted state to `state`
+
+        `state` is None once the CP is dropped. Call with cp.lock held.
+        """
+        counted = cp.counted_state
+        if counted == state:
+            return
+        with self._counts_lock:
+            if counted is not None:
+                self._state_counts[counted] -= 1
+            if state is not None:
+                self._state_counts[state] += 1
+        cp.counted_state = state
+
+    def _set_driver_status(self, driver, status):
+        """Set driver.status, keeping _charging_drivers in step; call with driver.lock held"""
+        delta = (status == "CHARGING") - (driver.status == "CHARGING")
+        if delta:
+            with self._counts_lock:
+                self._charging_drivers += delta
+        driver.status = status
+
+    def _set_available(self, cp_id, segment, refresh=False):
+        """Update the available-CP index, dropping the cached reply if it changed
+
+        `segment` is the CP's reply fields, or None if it is not available.
+        """
+        with self._available_lock:
+            listed = cp_id in self._available_cps
+            if segment is None:
+                if not listed:
+                    return
+                del self._available_cps[cp_id]
+            else:
+                if listed and not refresh:
+                    return
+                self._available_cps[cp_id] = segment
+            self._available_frame = None
+
     def _handle_query_available_cps(self, fields, client_socket, client_id):
         """Handle driver query for available CPs"""
         if len(fields) < 2:
@@ -776,264 +1490,406 @@ class EVCentral:
 
         driver_id = fields[1]
 
-        available_cps = []
-        with self.lock:
-            for cp_id, cp_data in self.charging_points.items():
-                if cp_data["state"] == CP_STATES["ACTIVATED"] and cp_data["current_driver"] is None:
-                    available_cps.append({
-                        "cp_id": cp_id,
-                        "location": cp_data["location"],
-                        "price_per_kwh": cp_data["price_per_kwh"]
-                    })
-
-        response_fields = [MessageTypes.AVAILABLE_CPS]
-        for cp in available_cps:
-            response_fields.extend([
-                cp["cp_id"],
-                cp["location"][0],
-                cp["location"][1],
-                cp["price_per_kwh"]
-            ])
+        with self._available_lock:
+            if self._available_frame is None:
+                available = self._available_cps
+                segments = [available[cp_id] for cp_id in sorted(available)]
+                self._available_frame = (Protocol.encode(
+                    Protocol.build_message(MessageTypes.AVAILABLE_CPS, *segments),
+                    None
+                ), len(segments))
+            response, count = self._available_frame
 
-        response = Protocol.encode(
-            Protocol.build_message(*response_fields),
-            None
-        )
-        client_socket.send(response)
+        self._send(client_socket, response)
 
-        print(f"[EV_Central] Sent {len(available_cps)} available CPs to {driver_id}")
+        log.debug("Sent %s available CPs to %s", count, driver_id)
 
     def display_dashboard(self):
-        """Display monitoring dashboard periodically"""
-        while self.running:
-            time.sleep(2)
+        """Redraw the monitoring dashboard when state changes"""
+        last_frame = None
+        while True:
+            # Wake on the next state change (shutdown sets it one last time)
+            self._dirty.wait()
+            if not self.running:
+                return
+            self._dirty.clear()
 
-            with self.lock:
-                print("\n" + "="*80)
-                print("EV_CENTRAL MONITORING DASHBOARD")
-                print("="*80)
+            cps = self._cp_snapshot
+            drivers = self._driver_snapshot
 
-                print("\n[CHARGING POINTS]")
-                if not self.charging_points:
-                    print("  No charging points registered")
-                else:
-                    for cp_id, cp_data in self.charging_points.items():
-                        color = COLORS.get(cp_data["state"], "?")
-                        print(f"  [{color}] {cp_id}: {cp_data['state']}")
-                        if cp_data["state"] == CP_STATES["SUPPLYING"]:
-                            print(f"      Driver: {cp_data['current_driver']}")
-                            print(f"      kWh: {cp_data['kwh_delivered']:.2f} kWh")
-                            print(f"      Amount: {cp_data['amount_euro']:.2f}€")
-
-                print("\n[DRIVERS]")
-                if not self.drivers:
-                    print("  No drivers registered")
-                else:
-                    for driver_id, driver_data in self.drivers.items():
-                        print(f"  {driver_id}: {driver_data['status']}")
-                        if driver_data['status'] == "CHARGING":
-                            print(f"      At: {driver_data['current_cp']}")
+            # _dirty is also set by changes the dashboard doesn't show (a
+            # re-register, a monitor joining): skip frames that render the same
+            frame = self._render_dashboard(cps, drivers)
+            if frame == last_frame:
+                continue
+            last_frame = frame
 
-                print("="*80 + "\n")
+            # One write per frame instead of a print() per line
+            sys.stdout.write(frame)
+            sys.stdout.flush()
 
-    def handle_admin_commands(self):
-        """Handle admin commands"""
-        while self.running:
-            try:
-                cmd = input("\n[ADMIN] Command (stop/resume <CP_ID>, list, history, quit): ").strip()
-
-                if cmd == "help":
-                    print("Commands:")
-                    print("  stop <CP_ID>    - Stop a charging point")
-                    print("  resume <CP_ID>  - Resume a charging point")
-                    print("  list            - List all charging points")
-                    print("  history         - Show recent charging history")
-                    print("  quit            - Shutdown system")
-                    continue
+    def _render_dashboard(self, cps, drivers):
+        """Format a dashboard frame from snapshots of CPs and drivers"""
+        parts = ["\n", "="*80, "\nEV_CENTRAL MONITORING DASHBOARD\n", "="*80, "\n"]
 
-                if cmd == "list":
-                    with self.lock:
-                        print("\n=== CHARGING POINTS ===")
-                        for cp_id, cp_data in self.charging_points.items():
-                            print(f"  {cp_id}: {cp_data['state']}")
-                            if cp_data["current_driver"]:
-                                print(f"    └─ Charging: {cp_data['current_driver']}")
-                    continue
+        parts.append("\n[CHARGING POINTS]\n")
+        if not cps:
+            parts.append("  No charging points registered\n")
+        else:
+            for cp_id, cp_data in cps:
+                color = COLORS.get(cp_data.state, "?")
+                parts.append(f"  [{color}] {cp_id}: {cp_data.state}\n")
+                if cp_data.state == CP_STATES["SUPPLYING"]:
+                    parts.append(f"      Driver: {cp_data.current_driver}\n")
+                    parts.append(f"      kWh: {cp_data.kwh_delivered:.2f} kWh\n")
+                    parts.append(f"      Amount: {cp_data.amount_euro:.2f}€\n")
+
+        parts.append("\n[DRIVERS]\n")
+        if not drivers:
+            parts.append("  No drivers registered\n")
+        else:
+            for driver_id, driver_data in drivers:
+                parts.append(f"  {driver_id}: {driver_data.status}\n")
+                if driver_data.status == "CHARGING":
+                    parts.append(f"      At: {driver_data.current_cp}\n")
+
+        parts.append("="*80 + "\n\n")
+        return "".join(parts)
+
+    def _open_admin_socket(self):
+        """Bind the local control socket used by evctl"""
+        if hasattr(socket, "AF_UNIX"):
+            if os.path.exists(self.admin_path):
+                os.unlink(self.admin_path)
+
+            self.admin_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.admin_socket.bind(self.admin_path)
+            where = self.admin_path
+        else:
+            # No Unix sockets (Windows): listen on loopback only
+            self.admin_path = None
+            self.admin_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.admin_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.admin_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.admin_socket.bind(("127.0.0.1", CENTRAL_ADMIN_PORT))
+            where = f"127.0.0.1:{CENTRAL_ADMIN_PORT}"
+
+        self.admin_socket.listen(5)
+        self.admin_socket.setblocking(False)
+        self.sel.register(self.admin_socket, selectors.EVENT_READ, self._accept_admin)
+
+        print(f"[EV_Central] Admin control socket: {where}")
+
+    def _accept_admin(self, admin_socket):
+        """Accept an evctl connection"""
+        try:
+            conn, _ = admin_socket.accept()
+        except BlockingIOError:
+            return
 
-                if cmd == "history":
-                    history = self.storage.get_recent_history(10)
-                    print("\n=== RECENT CHARGING HISTORY ===")
-                    if not history:
-                        print("  No history yet")
-                    else:
-                        for session in history:
-                            print(f"  {session['timestamp'][:19]}: {session['driver_id']} @ {session['cp_id']}")
-                            print(f"     → {session['kwh_delivered']} kWh, {session['total_amount']}€, {session['duration_seconds']}s")
-                    continue
+        conn.setblocking(False)
+        self.sel.register(conn, selectors.EVENT_READ, partial(self._read_admin, bytearray()))
 
-                if cmd == "quit":
-                    print("Shutting down...")
-                    self.running = False
-                    break
+    def _read_admin(self, buffer, conn):
+        """Collect one newline-terminated command, then run it on a worker"""
+        try:
+            data = conn.recv(1024)
+        except BlockingIOError:
+            return
+        except Exception:
+            data = b''
 
-                if cmd.startswith("stop"):
-                    parts = cmd.split()
-                    if len(parts) < 2:
-                        print("❌ Usage: stop <CP_ID>")
-                        continue
-                    
-                    cp_id = parts[1]
-                    
-                    driver_id = None
-                    was_charging = False
-                    
-                    with self.lock:
-                        if cp_id not in self.charging_points:
-                            print(f"❌ CP {cp_id} not found")
-                            continue
-                        
-                        cp = self.charging_points[cp_id]
-                        was_charging = (cp["state"] == CP_STATES["SUPPLYING"])
-                        driver_id = cp["current_driver"]
-                        
-                        if was_charging and driver_id:
-                            total_kwh = cp["kwh_delivered"]
-                            total_amount = total_kwh * cp["price_per_kwh"]
-                            duration_seconds = int(time.time() - cp["session_start"]) if cp["session_start"] else 0
-                            
-                            self.storage.save_charging_session(cp_id, driver_id, total_kwh, total_amount, duration_seconds)
-                            self.storage.update_driver_stats(driver_id, total_amount)
-                            
-                            print(f"⚠️  Charging session at {cp_id} interrupted ({total_kwh:.2f} kWh, {total_amount:.2f}€)")
-                            
-                            cp["current_driver"] = None
-                            cp["kwh_delivered"] = 0
-                            cp["amount_euro"] = 0
-                            cp["session_start"] = None
-                            cp["charging_complete"] = False
-                            
-                            if driver_id in self.drivers:
-                                self.drivers[driver_id]["status"] = "IDLE"
-                                self.drivers[driver_id]["current_cp"] = None
-                        
-                        cp["state"] = CP_STATES["STOPPED"]
-                    
-                    if cp_id in self.entity_to_socket:
-                        try:
-                            stop_msg = Protocol.encode(
-                                Protocol.build_message(MessageTypes.STOP_COMMAND, cp_id),
-                                self.cp_encryption_keys.get(cp_id)
-                            )
-
-                            self.entity_to_socket[cp_id].send(stop_msg)
-                            print(f"✅ CP {cp_id} stopped")
-                            
-                            if was_charging and driver_id and driver_id in self.entity_to_socket:
-                                ticket_msg = Protocol.encode(
-                                    Protocol.build_message(MessageTypes.TICKET, cp_id, total_kwh, total_amount),
-                                    None
-                                )
-
-                                self.entity_to_socket[driver_id].send(ticket_msg)
-                                print(f"📤 Ticket sent to driver {driver_id}")
-                                
-                        except Exception as e:
-                            print(f"❌ Failed to stop CP: {e}")
-                    else:
-                        print(f"❌ CP {cp_id} not connected")
-                    continue
+        buffer += data
+        if data and b'\n' not in buffer:
+            return
 
-                if cmd.startswith("resume"):
-                    parts = cmd.split()
-                    if len(parts) < 2:
-                        print("❌ Usage: resume <CP_ID>")
-                        continue
-                    
-                    cp_id = parts[1]
-                    if cp_id in self.entity_to_socket:
-                        with self.lock:
-                            if cp_id in self.charging_points:
-                                self.charging_points[cp_id]["state"] = CP_STATES["ACTIVATED"]
-                        
-                        try:
-                            resume_msg = Protocol.encode(
-                                Protocol.build_message(MessageTypes.RESUME_COMMAND, cp_id),
-                                self.cp_encryption_keys.get(cp_id)
-                            )
-
-                            self.entity_to_socket[cp_id].send(resume_msg)
-                            print(f"✅ CP {cp_id} resumed")
-                        except Exception as e:
-                            print(f"❌ Failed to resume CP: {e}")
-                    else:
-                        print(f"❌ CP {cp_id} not found or not connected")
-                    continue
+        self.sel.unregister(conn)
+        if not buffer.strip():
+            conn.close()
+            return
 
-                print("❌ Unknown command. Type 'help' for commands.")
+        # A script may pipe several commands in one write; run them all
+        cmds = [line for line in buffer.decode('utf-8', 'replace').splitlines() if line.strip()]
+        self.workers.submit(self._serve_admin, conn, cmds)
 
+    def _serve_admin(self, conn, cmds):
+        """Run admin commands and write their combined output back to evctl"""
+        replies = []
+        for cmd in cmds:
+            try:
+                replies.append(self.run_admin_command(cmd))
             except Exception as e:
-                print(f"❌ Command error: {e}")
+                replies.append(f"❌ Command error: {e}")
+
+        try:
+            conn.setblocking(True)
+            conn.sendall(("\n".join(replies) + "\n").encode('utf-8'))
+        except Exception:
+            pass
+        finally:
+            conn.close()
+
+    def run_admin_command(self, cmd):
+        """Execute one admin command and return its output"""
+        parts = cmd.split(None, 1)
+        if not parts:
+            return "❌ Unknown command. Type 'help' for commands."
+
+        command = self._admin_commands.get(parts[0])
+        if command is None:
+            return "❌ Unknown command. Type 'help' for commands."
+        return command(parts[1].split() if len(parts) > 1 else [])
+
+    def _admin_help(self, args):
+        """Admin: List the admin commands"""
+        return "\n".join([
+            "Commands:",
+            "  stop <CP_ID>...    - Stop one or more charging points",
+            "  resume <CP_ID>...  - Resume one or more charging points",
+            "  list               - List all charging points",
+            "  history            - Show recent charging history",
+            "  quit               - Shutdown system",
+        ])
+
+    def _admin_list(self, args):
+        """Admin: List every charging point and its state"""
+        lines = ["=== CHARGING POINTS ==="]
+        cps = self._cp_snapshot
+        for cp_id, cp_data in cps:
+            lines.append(f"  {cp_id}: {cp_data.state}")
+            if cp_data.current_driver:
+                lines.append(f"    └─ Charging: {cp_data.current_driver}")
+        return "\n".join(lines)
+
+    def _recent_history(self, limit):
+        """Last `limit` charging sessions, oldest first"""
+        if 0 < limit <= HISTORY_CACHE_SIZE:
+            return list(self._history)[-limit:]
+        # Beyond the cached tail (or a non-positive limit): read the file
+        return self.storage.get_recent_history(limit)
+
+    def _admin_history(self, args):
+        """Admin: Show the last ten charging sessions"""
+        history = self._recent_history(10)
+        lines = ["=== RECENT CHARGING HISTORY ==="]
+        if not history:
+            lines.append("  No history yet")
+        else:
+            for session in history:
+                lines.append(f"  {session['timestamp'][:19]}: {session['driver_id']} @ {session['cp_id']}")
+                lines.append(f"     → {session['kwh_delivered']} kWh, {session['total_amount']}€, {session['duration_seconds']}s")
+        return "\n".join(lines)
+
+    def _admin_quit(self, args):
+        """Admin: Shut EV_Central down"""
+        log.info("Shutdown requested from admin socket")
+        self.stop()
+        return "Shutting down..."
+
+    def _admin_stop(self, args):
+        """Admin: Stop each CP in args"""
+        if not args:
+            return "❌ Usage: stop <CP_ID>..."
+        return "\n".join(self._handle_stop(cp_id) for cp_id in args)
+
+    def _admin_resume(self, args):
+        """Admin: Resume each CP in args"""
+        if not args:
+            return "❌ Usage: resume <CP_ID>..."
+        return "\n".join(self._handle_resume(cp_id) for cp_id in args)
+
+    def _handle_stop(self, cp_id):
+        """Admin: stop a charging point, closing any active session"""
+        cp = self.charging_points.get(cp_id)
+
+        if cp is None:
+            return f"❌ CP {cp_id} not found"
+
+        lines = []
+        driver_id = None
+        was_charging = False
+
+        with cp.lock:
+            was_charging = (cp.state == CP_STATES["SUPPLYING"])
+            driver_id = cp.current_driver
+            
+            if was_charging and driver_id:
+                total_kwh = cp.kwh_delivered
+                total_amount = total_kwh * cp.price_per_kwh
+                duration_seconds = int(time.time() - cp.session_start) if cp.session_start else 0
+                
+                cp.clear_session()
+            
+            cp.state = CP_STATES["STOPPED"]
+            self._track_availability(cp_id, cp)
+
+        if was_charging and driver_id:
+            self._finalize_session(cp_id, driver_id, total_kwh, total_amount, duration_seconds)
+            lines.append(f"⚠️  Charging session at {cp_id} interrupted ({total_kwh:.2f} kWh, {total_amount:.2f}€)")
+        self._state_changed()
+        
+        cp_sock = self.entity_to_socket.get(cp_id)
+        if cp_sock is None:
+            lines.append(f"❌ CP {cp_id} not connected")
+        else:
+            stop_msg = _encode(self.cp_encryption_keys.get(cp_id), MessageTypes.STOP_COMMAND, cp_id)
+
+            if self._send(cp_sock, stop_msg):
+                lines.append(f"✅ CP {cp_id} stopped")
+                log.info("🛑 CP %s stopped by admin", cp_id)
+                
+                if was_charging and self._send_ticket(driver_id, cp_id, total_kwh, total_amount):
+                    lines.append(f"📤 Ticket sent to driver {driver_id}")
+            else:
+                lines.append(f"❌ Failed to stop CP {cp_id}: connection lost")
+
+        return "\n".join(lines)
+
+    def _handle_resume(self, cp_id):
+        """Admin: put a stopped charging point back in service"""
+        cp_sock = self.entity_to_socket.get(cp_id)
+        if cp_sock is None:
+            return f"❌ CP {cp_id} not found or not connected"
+
+        cp = self.charging_points.get(cp_id)
+        if cp is not None:
+            with cp.lock:
+                cp.state = CP_STATES["ACTIVATED"]
+                self._track_availability(cp_id, cp)
+            self._state_changed()
+        
+        resume_msg = _encode(self.cp_encryption_keys.get(cp_id), MessageTypes.RESUME_COMMAND, cp_id)
+
+        if not self._send(cp_sock, resume_msg):
+            return f"❌ Failed to resume CP {cp_id}: connection lost"
+        log.info("▶️ CP %s resumed by admin", cp_id)
+        return f"✅ CP {cp_id} resumed"
+
+    def stop(self):
+        """Ask the reactors to exit; safe to call from a signal handler"""
+        self.running = False
+        try:
+            self._wakeup_w.send(b'\0')
+        except OSError:
+            pass
 
     def shutdown(self):
         """Shutdown the central system"""
         self.running = False
-        if self.server_socket:
-            self.server_socket.close()
+        self._dirty.set()
+        for server_socket in self.server_sockets:
+            server_socket.close()
+        if self.admin_socket:
+            self.admin_socket.close()
+            if self.admin_path:
+                try:
+                    os.unlink(self.admin_path)
+                except OSError:
+                    pass
+        self.workers.shutdown(wait=False)
+        with self._updates_cv:
+            self._updates_cv.notify_all()
+        for sel in self.reactors:
+            sel.close()
+        self._wakeup_r.close()
+        self._wakeup_w.close()
+
+        if self._kafka_thread is not None:
+            try:
+                self._kafka_q.put_nowait(None)
+            except queue.Full:
+                pass
+            self._kafka_thread.join(timeout=5)
+        self.kafka.flush(timeout=5)
         self.kafka.close()
+
+        if self._storage_thread is not None:
+            self._storage_q.put(None)
+            self._storage_thread.join(timeout=5)
         print("[EV_Central] Shutdown complete")
 
+    def _state_changed(self):
+        """Flag a dashboard/API-visible change: redraw and drop cached bodies"""
+        self._state_version = next(self._versions)
+        self._dirty.set()
+
+    def _cached_json(self, name, build):
+        """Serve build()'s JSON, re-encoding it only after a state change
+
+        Answers 304 when the client's If-None-Match still matches.
+        """
+        version = self._state_version
+        cached = self._json_cache.get(name)
+        if cached is None or cached[0] != version:
+            response = jsonify(build())
+            response.add_etag()
+            cached = (version, response.get_data(), response.get_etag()[0])
+            self._json_cache[name] = cached
+
+        response = self.app.response_class(cached[1], mimetype="application/json")
+        response.set_etag(cached[2])
+        return response.make_conditional(request)
+
     def _setup_flask_routes(self):
         """Setup all REST API routes"""
         
-        @self.app.route('/api/cps', methods=['GET'])
-        def get_cps():
-            """Get all charging points with their current status"""
-            with self.lock:
-                cps_list = []
-                for cp_id, cp_data in self.charging_points.items():
-                    cps_list.append({
-                        "cp_id": cp_id,
-                        "state": cp_data["state"],
-                        "location": {
-                            "latitude": cp_data["location"][0],
-                            "longitude": cp_data["location"][1]
-                        },
-                        "price_per_kwh": cp_data["price_per_kwh"],
-                        "current_driver": cp_data["current_driver"],
-                        "kwh_delivered": cp_data["kwh_delivered"],
-                        "amount_euro": cp_data["amount_euro"],
-                        "charging_complete": cp_data.get("charging_complete", False)
-                    })
+        def build_cps():
+            cps = self._cp_snapshot
+
+            cps_list = []
+            for cp_id, cp_data in cps:
+                cps_list.append({
+                    "cp_id": cp_id,
+                    "state": cp_data.state,
+                    "location": {
+                        "latitude": cp_data.location[0],
+                        "longitude": cp_data.location[1]
+                    },
+                    "price_per_kwh": cp_data.price_per_kwh,
+                    "current_driver": cp_data.current_driver,
+                    "kwh_delivered": cp_data.kwh_delivered,
+                    "amount_euro": cp_data.amount_euro,
+                    "charging_complete": cp_data.charging_complete
+                })
             
-            return jsonify({
+            return {
                 "success": True,
                 "count": len(cps_list),
                 "charging_points": cps_list
-            }), 200
+            }
 
-        @self.app.route('/api/drivers', methods=['GET'])
-        def get_drivers():
-            """Get all drivers with their current status"""
-            with self.lock:
-                drivers_list = []
-                for driver_id, driver_data in self.drivers.items():
-                    drivers_list.append({
-                        "driver_id": driver_id,
-                        "status": driver_data["status"],
-                        "current_cp": driver_data["current_cp"]
-                    })
+        @self.app.route('/api/cps', methods=['GET'])
+        def get_cps():
+            """Get all charging points with their current status"""
+            return self._cached_json("cps", build_cps)
+
+        def build_drivers():
+            drivers = self._driver_snapshot
+
+            drivers_list = []
+            for driver_id, driver_data in drivers:
+                drivers_list.append({
+                    "driver_id": driver_id,
+                    "status": driver_data.status,
+                    "current_cp": driver_data.current_cp
+                })
             
-            return jsonify({
+            return {
                 "success": True,
                 "count": len(drivers_list),
                 "drivers": drivers_list
-            }), 200
+            }
+
+        @self.app.route('/api/drivers', methods=['GET'])
+        def get_drivers():
+            """Get all drivers with their current status"""
+            return self._cached_json("drivers", build_drivers)
 
         @self.app.route('/api/history', methods=['GET'])
         def get_history():
             """Get recent charging history"""
             limit = request.args.get('limit', default=20, type=int)
-            history = self.storage.get_recent_history(limit)
+            history = self._recent_history(limit)
             
             return jsonify({
                 "success": True,
@@ -1041,23 +1897,19 @@ class EVCentral:
                 "history": history
             }), 200
 
-        @self.app.route('/api/status', methods=['GET'])
-        def get_status():
-            """Get overall system status"""
+        def build_status():
+            # Counters are kept at each transition: no scan per request
+            with self._counts_lock:
+                active_cps = self._state_counts[CP_STATES["ACTIVATED"]]
+                charging_cps = self._state_counts[CP_STATES["SUPPLYING"]]
+                out_of_order_cps = self._state_counts[CP_STATES["OUT_OF_ORDER"]]
+                charging_drivers = self._charging_drivers
+            total_cps = len(self._cp_snapshot)
+            total_drivers = len(self._driver_snapshot)
             with self.lock:
-                total_cps = len(self.charging_points)
-                active_cps = sum(1 for cp in self.charging_points.values() 
-                            if cp["state"] == CP_STATES["ACTIVATED"])
-                charging_cps = sum(1 for cp in self.charging_points.values() 
-                                if cp["state"] == CP_STATES["SUPPLYING"])
-                out_of_order_cps = sum(1 for cp in self.charging_points.values() 
-                                    if cp["state"] == CP_STATES["OUT_OF_ORDER"])
-                
-                total_drivers = len(self.drivers)
-                charging_drivers = sum(1 for d in self.drivers.values() 
-                                    if d["status"] == "CHARGING")
+                weather_alerts = list(self.weather_alerts.values())
             
-            return jsonify({
+            return {
                 "success": True,
                 "system_status": "operational",
                 "charging_points": {
@@ -1070,8 +1922,13 @@ class EVCentral:
                     "total": total_drivers,
                     "charging": charging_drivers
                 },
-                "weather_alerts": self.weather_alerts
-            }), 200
+                "weather_alerts": weather_alerts
+            }
+
+        @self.app.route('/api/status', methods=['GET'])
+        def get_status():
+            """Get overall system status"""
+            return self._cached_json("status", build_status)
 
         @self.app.route('/api/weather/alert', methods=['POST'])
         def weather_alert():
@@ -1088,70 +1945,52 @@ class EVCentral:
             location = data.get('location', 'Unknown')
             temperature = data.get('temperature', 0)
             
-            with self.lock:
-                if cp_id not in self.charging_points:
-                    return jsonify({
-                        "success": False,
-                        "error": f"CP {cp_id} not found"
-                    }), 404
-                
-                cp = self.charging_points[cp_id]
-                
+            cp = self.charging_points.get(cp_id)
+
+            if cp is None:
+                return jsonify({
+                    "success": False,
+                    "error": f"CP {cp_id} not found"
+                }), 404
+
+            driver_id = None
+            with cp.lock:
                 # If currently charging, end the session
-                if cp["state"] == CP_STATES["SUPPLYING"] and cp["current_driver"]:
-                    driver_id = cp["current_driver"]
-                    kwh = cp["kwh_delivered"]
-                    amount = cp["amount_euro"]
-                    duration = int(time.time() - cp["session_start"]) if cp["session_start"] else 0
-                    
-                    # Save session
-                    self.storage.save_charging_session(cp_id, driver_id, kwh, amount, duration)
-                    self.storage.update_driver_stats(driver_id, amount)
-                    
-                    # Notify driver
-                    if driver_id in self.entity_to_socket:
-                        try:
-                            ticket_msg = Protocol.encode(
-                                Protocol.build_message(MessageTypes.TICKET, cp_id, kwh, amount),
-                                None
-                            )
-
-                            self.entity_to_socket[driver_id].send(ticket_msg)
-                        except:
-                            pass
-                    
+                if cp.state == CP_STATES["SUPPLYING"] and cp.current_driver:
+                    driver_id = cp.current_driver
+                    kwh = cp.kwh_delivered
+                    amount = cp.amount_euro
+                    duration = int(time.time() - cp.session_start) if cp.session_start else 0
+
                     # Reset CP state
-                    cp["current_driver"] = None
-                    cp["kwh_delivered"] = 0
-                    cp["amount_euro"] = 0
-                    cp["session_start"] = None
-                    cp["charging_complete"] = False
-                    
-                    if driver_id in self.drivers:
-                        self.drivers[driver_id]["status"] = "IDLE"
-                        self.drivers[driver_id]["current_cp"] = None
-                
+                    cp.clear_session()
+
                 # Set CP to OUT_OF_ORDER
-                cp["state"] = CP_STATES["OUT_OF_ORDER"]
-                
-                # Add to weather alerts
-                alert = {
-                    "cp_id": cp_id,
-                    "location": location,
-                    "temperature": temperature,
-                    "timestamp": datetime.now().isoformat(),
-                    "message": f"⚠️ CP {cp_id} disabled - Temperature {temperature}°C"
-                }
-                self.weather_alerts.append(alert)
-            
-            print(f"\n[EV_Central] ❄️ Weather Alert: CP {cp_id} at {location} - {temperature}°C")
-            print(f"[EV_Central] → CP {cp_id} now OUT_OF_ORDER\n")
-            
-            self.kafka.publish_event("system_events", "WEATHER_ALERT", {
+                cp.state = CP_STATES["OUT_OF_ORDER"]
+                self._track_availability(cp_id, cp)
+
+            if driver_id:
+                self._finalize_session(cp_id, driver_id, kwh, amount, duration)
+                self._send_ticket(driver_id, cp_id, kwh, amount)
+
+            # Add to weather alerts
+            alert = {
                 "cp_id": cp_id,
                 "location": location,
-                "temperature": temperature
-            })
+                "temperature": temperature,
+                "timestamp": datetime.now().isoformat(),
+                "message": f"⚠️ CP {cp_id} disabled - Temperature {temperature}°C"
+            }
+
+            with self.lock:
+                self.weather_alerts[cp_id] = alert
+            self._state_changed()
+            
+            log.warning("❄️ Weather Alert: CP %s at %s - %s°C", cp_id, location, temperature)
+            log.warning("→ CP %s now OUT_OF_ORDER", cp_id)
+            
+            self._publish("system_events", "WEATHER_ALERT",
+                          WeatherEvent(cp_id, location, temperature))
             
             return jsonify({
                 "success": True,
@@ -1173,33 +2012,32 @@ class EVCentral:
             location = data.get('location', 'Unknown')
             temperature = data.get('temperature', 0)
             
-            with self.lock:
-                if cp_id not in self.charging_points:
-                    return jsonify({
-                        "success": False,
-                        "error": f"CP {cp_id} not found"
-                    }), 404
-                
-                cp = self.charging_points[cp_id]
-                
-                # Only restore if it was OUT_OF_ORDER due to weather
-                if cp["state"] == CP_STATES["OUT_OF_ORDER"]:
-                    cp["state"] = CP_STATES["ACTIVATED"]
-                    
-                    # Remove from weather alerts
-                    self.weather_alerts = [
-                        a for a in self.weather_alerts 
-                        if a["cp_id"] != cp_id
-                    ]
+            cp = self.charging_points.get(cp_id)
+
+            if cp is None:
+                return jsonify({
+                    "success": False,
+                    "error": f"CP {cp_id} not found"
+                }), 404
+
+            # Only restore if it was OUT_OF_ORDER due to weather
+            with cp.lock:
+                restored = cp.state == CP_STATES["OUT_OF_ORDER"]
+                if restored:
+                    cp.state = CP_STATES["ACTIVATED"]
+                    self._track_availability(cp_id, cp)
+
+            if restored:
+                # Remove from weather alerts
+                with self.lock:
+                    self.weather_alerts.pop(cp_id, None)
+                self._state_changed()
             
-            print(f"\n[EV_Central] ☀️ Weather Clear: CP {cp_id} at {location} - {temperature}°C")
-            print(f"[EV_Central] → CP {cp_id} now ACTIVATED\n")
+            log.info("☀️ Weather Clear: CP %s at %s - %s°C", cp_id, location, temperature)
+            log.info("→ CP %s now ACTIVATED", cp_id)
             
-            self.kafka.publish_event("system_events", "WEATHER_CLEAR", {
-                "cp_id": cp_id,
-                "location": location,
-                "temperature": temperature
-            })
+            self._publish("system_events", "WEATHER_CLEAR",
+                          WeatherEvent(cp_id, location, temperature))
             
             return jsonify({
                 "success": True,
@@ -1209,15 +2047,22 @@ class EVCentral:
     def start_flask(self):
         """Start Flask REST API server"""
         print("[EV_Central] Starting Flask REST API on port 5000...")
-        self.app.run(host='0.0.0.0', port=8080, threaded=True, debug=False)
+        if serve is not None:
+            # A fixed pool of request threads behind one async accept loop;
+            # waitress also sets TCP_NODELAY on every connection
+            serve(self.app, host='0.0.0.0', port=8080, threads=CENTRAL_HTTP_THREADS)
+        else:
+            self.app.run(host='0.0.0.0', port=8080, threaded=True, debug=False)
 
 
 if __name__ == "__main__":
+    log_listener = _setup_logging()
     central = EVCentral()
 
-    # Start server in separate thread
-    server_thread = threading.Thread(target=central.start, daemon=True)
-    server_thread.start()
+    # docker stop sends SIGTERM: leave the reactor loop and shut down cleanly
+    def _stop(signum, frame):
+        central.stop()
+    signal.signal(signal.SIGTERM, _stop)
 
     # Start dashboard in separate thread
     dashboard_thread = threading.Thread(target=central.display_dashboard, daemon=True)
@@ -1231,9 +2076,6 @@ if __name__ == "__main__":
     flask_thread = threading.Thread(target=central.start_flask, daemon=True)
     flask_thread.start()
 
-    # Start admin console
-    try:
-        central.handle_admin_commands()
-    except KeyboardInterrupt:
-        print("\n[EV_Central] Shutting down...")
-        central.shutdown()
\ No newline at end of file
+    # Server runs in the main thread; admin commands arrive via central/evctl.py
+    central.start()
+    log_listener.stop()
@@ -0,0 +1,59 @@
+# ============================================================================
+# EVCharging System - evctl (EV_Central admin console)
+# ============================================================================
+
+import socket
+import sys
+from config import CENTRAL_ADMIN_SOCKET, CENTRAL_ADMIN_PORT
+
+
+def _connect(path):
+    if hasattr(socket, "AF_UNIX"):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(path)
+        return sock
+    sock = socket.create_connection(("127.0.0.1", CENTRAL_ADMIN_PORT))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def send_command(cmd, path=CENTRAL_ADMIN_SOCKET):
+    """Send one command to EV_Central and return its reply"""
+    with _connect(path) as sock:
+        sock.sendall((cmd.strip() + "\n").encode('utf-8'))
+
+        chunks = []
+        while True:
+            data = sock.recv(4096)
+            if not data:
+                break
+            chunks.append(data)
+
+    return b''.join(chunks).decode('utf-8').rstrip("\n")
+
+
+def run_command(cmd):
+    try:
+        print(send_command(cmd))
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"❌ EV_Central is not running (no admin socket at {CENTRAL_ADMIN_SOCKET})")
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(0 if run_command(" ".join(sys.argv[1:])) else 1)
+
+    # Interactive console
+    while True:
+        try:
+            cmd = input("\n[ADMIN] Command (stop/resume <CP_ID>, list, history, quit): ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+
+        if not cmd:
+            continue
+        if not run_command(cmd) or cmd == "quit":
+            break
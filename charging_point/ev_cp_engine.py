@@ -8,6 +8,7 @@ import time
 import sys
 import requests
 import os
+from dataclasses import dataclass
 from datetime import datetime
 from config import CP_BASE_PORT, CP_STATES, COLORS, SUPPLY_UPDATE_INTERVAL
 from shared.protocol import Protocol
@@ -16,6 +17,17 @@ from shared.encryption import EncryptionManager
 
 REGISTRY_URL = os.getenv("REGISTRY_URL", "http://registry:5001")
 
+
+@dataclass(slots=True)
+class ChargingSession:
+    """Session in progress; guarded by EVCPEngine.lock"""
+    driver_id: str
+    start_time: float
+    kwh_needed: float
+    kwh_delivered: float = 0.0
+    amount: float = 0.0
+
+
 class EVCPEngine:
     def __init__(self, cp_id, latitude, longitude, price_per_kwh, 
                  central_host="localhost", central_port=5000,
@@ -41,6 +53,8 @@ class EVCPEngine:
         self.monitor_socket = None
         self.running = True
         self.lock = threading.Lock()
+        # Orders frames on central_socket; taken before self.lock, never after
+        self.send_lock = threading.Lock()
 
         # Kafka
         self.kafka = KafkaClient(f"EV_CP_E_{cp_id}")
@@ -100,6 +114,7 @@ class EVCPEngine:
         try:
             self.central_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.central_socket.connect((self.central_host, self.central_port))
+            self.central_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
             # Register with CENTRAL
             register_msg = Protocol.encode(
@@ -111,7 +126,7 @@ class EVCPEngine:
                 self.encryption_key
             )
 
-            self.central_socket.send(register_msg)
+            self.central_socket.sendall(register_msg)
             print(f"[{self.cp_id}] Registered with CENTRAL")
 
             # Start listening for messages from CENTRAL
@@ -132,6 +147,7 @@ class EVCPEngine:
         try:
             server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             server_socket.bind(('0.0.0.0', self.monitor_port))
             server_socket.listen(1)
 
@@ -140,6 +156,7 @@ class EVCPEngine:
             while self.running:
                 try:
                     client_socket, addr = server_socket.accept()
+                    client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                     self.monitor_socket = client_socket
                     print(f"[{self.cp_id}] Monitor connected")
 
@@ -160,7 +177,7 @@ class EVCPEngine:
 
     def _listen_central(self):
         """Listen for messages from CENTRAL via socket"""
-        buffer = b''
+        buffer = bytearray()
         try:
             while self.running:
                 try:
@@ -171,11 +188,10 @@ class EVCPEngine:
                     buffer += data
 
                     while len(buffer) > 0:
-                        message, is_valid = Protocol.decode(buffer, self.encryption_key)
+                        message, is_valid, end = Protocol.decode_frame(buffer, 0, self.encryption_key)
 
                         if is_valid:
-                            etx_pos = buffer.find(b'\x03')
-                            buffer = buffer[etx_pos + 2:]
+                            del buffer[:end]
 
                             fields = Protocol.parse_message(message)
                             
@@ -233,7 +249,7 @@ class EVCPEngine:
                                 self.encryption_key
                             )
 
-                        self.monitor_socket.send(response)
+                        self.monitor_socket.sendall(response)
 
         except Exception as e:
             print(f"[{self.cp_id}] Monitor listener error: {e}")
@@ -244,48 +260,43 @@ class EVCPEngine:
         kwh_needed = float(fields[3]) if len(fields) > 3 else 10
 
         with self.lock:
-            if self.state == CP_STATES["ACTIVATED"]:
+            authorized = self.state == CP_STATES["ACTIVATED"]
+            if authorized:
                 self.current_driver = driver_id
                 self.state = CP_STATES["SUPPLYING"]
                 self.charging_complete = False
-                self.current_session = {
-                    "driver_id": driver_id,
-                    "start_time": time.time(),
-                    "kwh_needed": kwh_needed,
-                    "kwh_delivered": 0.0,
-                    "amount": 0.0
-                }
+                self.current_session = ChargingSession(driver_id, time.time(), kwh_needed)
 
-                print(f"\n[{self.cp_id}] ✅ Charging authorized")
-                print(f"[{self.cp_id}] → IN USE - CHARGING\n")
+        if authorized:
+            print(f"\n[{self.cp_id}] ✅ Charging authorized")
+            print(f"[{self.cp_id}] → IN USE - CHARGING\n")
 
     def _handle_stop_command(self):
         """Handle STOP command from CENTRAL"""
-        with self.lock:
-            if self.state == CP_STATES["SUPPLYING"] and self.current_session:
-                driver_id = self.current_driver
-                session = self.current_session
-                kwh_delivered = session["kwh_delivered"]
-                total_amount = round(kwh_delivered * self.price_per_kwh, 2)
+        end_msg = None
+        send_error = None
+        with self.send_lock:
+            with self.lock:
+                if self.state == CP_STATES["SUPPLYING"] and self.current_session:
+                    driver_id = self.current_driver
+                    kwh_delivered = self.current_session.kwh_delivered
+                    total_amount = round(kwh_delivered * self.price_per_kwh, 2)
+                    end_msg = self._supply_end_frame(driver_id, kwh_delivered, total_amount)
+
+                    self.current_driver = None
+                    self.current_session = None
+                    self.charging_complete = False
                 
-                end_msg = Protocol.encode(
-                    Protocol.build_message(
-                        "SUPPLY_END", self.cp_id, driver_id,
-                        kwh_delivered, total_amount
-                    ),
-                    self.encryption_key
-                )
+                self.state = CP_STATES["STOPPED"]
 
+            if end_msg is not None:
                 try:
-                    self.central_socket.send(end_msg)
+                    self.central_socket.sendall(end_msg)
                 except Exception as e:
-                    print(f"[{self.cp_id}] Error notifying supply end: {e}")
-                
-                self.current_driver = None
-                self.current_session = None
-                self.charging_complete = False
-            
-            self.state = CP_STATES["STOPPED"]
+                    send_error = e
+
+        if send_error is not None:
+            print(f"[{self.cp_id}] Error notifying supply end: {send_error}")
         
         print(f"[{self.cp_id}] Received STOP command from CENTRAL - now stopped")
 
@@ -298,73 +309,73 @@ class EVCPEngine:
 
     def _handle_end_supply(self):
         """Handle END_SUPPLY command from CENTRAL"""
-        with self.lock:
-            if self.state == CP_STATES["SUPPLYING"] and self.current_session:
+        send_error = None
+        with self.send_lock:
+            with self.lock:
+                if not (self.state == CP_STATES["SUPPLYING"] and self.current_session):
+                    return
                 driver_id = self.current_driver
-                session = self.current_session
-
-                elapsed = time.time() - session["start_time"]
-                total_seconds = 14.0
-                kwh_delivered = min(session["kwh_needed"], (elapsed / total_seconds) * session["kwh_needed"])
-                total_amount = round(kwh_delivered * self.price_per_kwh, 2)
-
-                print(f"\n[{self.cp_id}] Supply ended by CENTRAL")
-                print(f"[{self.cp_id}] {kwh_delivered:.3f} kWh, {total_amount:.2f}€")
-
-                end_msg = Protocol.encode(
-                    Protocol.build_message(
-                        "SUPPLY_END", self.cp_id, driver_id,
-                        kwh_delivered, total_amount
-                    ),
-                    self.encryption_key
-                )
-
-                try:
-                    self.central_socket.send(end_msg)
-                except Exception as e:
-                    print(f"[{self.cp_id}] Error notifying supply end: {e}")
+                kwh_delivered, total_amount = self._session_totals()
+                end_msg = self._supply_end_frame(driver_id, kwh_delivered, total_amount)
 
                 self.state = CP_STATES["ACTIVATED"]
                 self.current_driver = None
                 self.current_session = None
                 self.charging_complete = False
-                
-                print(f"[{self.cp_id}] → AVAILABLE\n")
 
-    def stop_charging(self):
-        """Simulate driver unplugging vehicle from CP"""
-        with self.lock:
-            if self.state == CP_STATES["SUPPLYING"]:
-                driver_id = self.current_driver
-                session = self.current_session
+            try:
+                self.central_socket.sendall(end_msg)
+            except Exception as e:
+                send_error = e
 
-                elapsed = time.time() - session["start_time"]
-                total_seconds = 14.0
-                kwh_delivered = min(session["kwh_needed"], (elapsed / total_seconds) * session["kwh_needed"])
-                total_amount = round(kwh_delivered * self.price_per_kwh, 2)
+        print(f"\n[{self.cp_id}] Supply ended by CENTRAL")
+        print(f"[{self.cp_id}] {kwh_delivered:.3f} kWh, {total_amount:.2f}€")
 
-                print(f"\n[{self.cp_id}] Vehicle unplugged")
-                print(f"[{self.cp_id}] {kwh_delivered:.3f} kWh, {total_amount:.2f}€")
+        if send_error is not None:
+            print(f"[{self.cp_id}] Error notifying supply end: {send_error}")
 
-                end_msg = Protocol.encode(
-                    Protocol.build_message(
-                        "SUPPLY_END", self.cp_id, driver_id,
-                        kwh_delivered, total_amount
-                    ),
-                    self.encryption_key
-                )
+        print(f"[{self.cp_id}] → AVAILABLE\n")
 
-                self.central_socket.send(end_msg)
+    def stop_charging(self):
+        """Simulate driver unplugging vehicle from CP"""
+        with self.send_lock:
+            with self.lock:
+                if self.state != CP_STATES["SUPPLYING"]:
+                    return False
+                driver_id = self.current_driver
+                kwh_delivered, total_amount = self._session_totals()
+                end_msg = self._supply_end_frame(driver_id, kwh_delivered, total_amount)
 
                 self.state = CP_STATES["ACTIVATED"]
                 self.current_driver = None
                 self.current_session = None
                 self.charging_complete = False
 
-                print(f"[{self.cp_id}] → AVAILABLE\n")
-                return True
-
-        return False
+            self.central_socket.sendall(end_msg)
+
+        print(f"\n[{self.cp_id}] Vehicle unplugged")
+        print(f"[{self.cp_id}] {kwh_delivered:.3f} kWh, {total_amount:.2f}€")
+
+        print(f"[{self.cp_id}] → AVAILABLE\n")
+        return True
+
+    def _session_totals(self):
+        """kWh and € for the current session by elapsed time; call with self.lock held"""
+        session = self.current_session
+        elapsed = time.time() - session.start_time
+        total_seconds = 14.0
+        kwh_delivered = min(session.kwh_needed, (elapsed / total_seconds) * session.kwh_needed)
+        return kwh_delivered, round(kwh_delivered * self.price_per_kwh, 2)
+
+    def _supply_end_frame(self, driver_id, kwh_delivered, total_amount):
+        """Encoded SUPPLY_END for CENTRAL"""
+        return Protocol.encode(
+            Protocol.build_message(
+                "SUPPLY_END", self.cp_id, driver_id,
+                kwh_delivered, total_amount
+            ),
+            self.encryption_key
+        )
 
     def send_status_updates(self):
         """Send status updates to CENTRAL every second"""
@@ -372,56 +383,70 @@ class EVCPEngine:
             time.sleep(SUPPLY_UPDATE_INTERVAL)
 
             try:
-                with self.lock:
-                    # Always send heartbeat
-                    try:
-                        heartbeat = Protocol.encode(
+                # Advance the session and send under send_lock so no end path
+                # can put SUPPLY_END on the wire between capture and send;
+                # print once both locks are released
+                update = None
+                fully_charged = False
+                send_error = None
+                with self.send_lock:
+                    with self.lock:
+                        state = self.state
+
+                        # If charging, send detailed update
+                        if self.state == CP_STATES["SUPPLYING"] and self.current_session:
+                            session = self.current_session
+
+                            kwh_this_second = session.kwh_needed / 14.0
+                            session.kwh_delivered += kwh_this_second
+
+                            if session.kwh_delivered >= session.kwh_needed:
+                                session.kwh_delivered = session.kwh_needed
+                                
+                                if not self.charging_complete:
+                                    self.charging_complete = True
+                                    fully_charged = True
+                            else:
+                                amount = session.kwh_delivered * self.price_per_kwh
+                                session.amount = amount
+                                update = (session.kwh_delivered, kwh_this_second, amount)
+
+                    # Always send heartbeat; while charging the SUPPLY_UPDATE
+                    # rides in the same write instead of a second small segment
+                    frames = [Protocol.encode(
+                        Protocol.build_message(
+                            "HEARTBEAT", self.cp_id, state
+                        ),
+                        self.encryption_key
+                    )]
+
+                    if update is not None:
+                        kwh_delivered, kwh_this_second, amount = update
+                        frames.append(Protocol.encode(
                             Protocol.build_message(
-                                "HEARTBEAT", self.cp_id, self.state
+                                "SUPPLY_UPDATE",
+                                self.cp_id,
+                                f"{kwh_this_second:.6f}",
+                                f"{amount:.2f}"
                             ),
                             self.encryption_key
-                        )
+                        ))
 
-                        self.central_socket.send(heartbeat)
+                    try:
+                        self.central_socket.sendall(b''.join(frames))
                     except Exception as e:
-                        print(f"[{self.cp_id}] ❌ Failed to send HEARTBEAT: {e}")
-
-                    # If charging, send detailed update
-                    if self.state == CP_STATES["SUPPLYING"] and self.current_session:
-                        session = self.current_session
-
-                        kwh_this_second = session["kwh_needed"] / 14.0
-                        session["kwh_delivered"] += kwh_this_second
-
-                        if session["kwh_delivered"] >= session["kwh_needed"]:
-                            session["kwh_delivered"] = session["kwh_needed"]
-                            
-                            if not self.charging_complete:
-                                self.charging_complete = True
-                                print(f"\n[{self.cp_id}] 🔋 Charged fully, waiting for driver to unplug")
-                            
-                            continue
+                        send_error = e
 
-                        amount = session["kwh_delivered"] * self.price_per_kwh
-                        session["amount"] = amount
+                if fully_charged:
+                    print(f"\n[{self.cp_id}] 🔋 Charged fully, waiting for driver to unplug")
 
-                        # Display charging progress
-                        print(f"[{self.cp_id}] {session['kwh_delivered']:.3f} kWh | {amount:.2f}€ (IN USE - CHARGING)")
-
-                        try:
-                            update_msg = Protocol.encode(
-                                Protocol.build_message(
-                                    "SUPPLY_UPDATE",
-                                    self.cp_id,
-                                    f"{kwh_this_second:.6f}",
-                                    f"{amount:.2f}"
-                                ),
-                                self.encryption_key
-                            )
+                if update is not None:
+                    # Display charging progress
+                    print(f"[{self.cp_id}] {kwh_delivered:.3f} kWh | {amount:.2f}€ (IN USE - CHARGING)")
 
-                            self.central_socket.send(update_msg)
-                        except Exception as e:
-                            print(f"[{self.cp_id}] ❌ Failed to send SUPPLY_UPDATE: {e}")
+                if send_error is not None:
+                    kind = "HEARTBEAT" if update is None else "HEARTBEAT/SUPPLY_UPDATE"
+                    print(f"[{self.cp_id}] ❌ Failed to send {kind}: {send_error}")
 
             except Exception as e:
                 print(f"[{self.cp_id}] ❌ Error in status update loop: {e}")
@@ -55,6 +55,7 @@ class EVCPMonitor:
             try:
                 self.engine_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.engine_socket.connect((self.engine_host, self.engine_port))
+                self.engine_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                 print(f"[{self.cp_id} Monitor] ✅ Connected to Engine")
                 return True
             except Exception as e:
@@ -77,12 +78,13 @@ class EVCPMonitor:
             try:
                 self.central_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.central_socket.connect((self.central_host, self.central_port))
+                self.central_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
                 # Register as monitor with CENTRAL
                 register_msg = Protocol.encode(
                     Protocol.build_message(MessageTypes.REGISTER, "MONITOR", self.cp_id, self.cp_id)
                 )
-                self.central_socket.send(register_msg)
+                self.central_socket.sendall(register_msg)
 
                 print(f"[{self.cp_id} Monitor] ✅ Connected to CENTRAL")
                 return True
@@ -97,7 +99,7 @@ class EVCPMonitor:
 
     def _listen_central(self):
         """Listen for driver notifications from CENTRAL"""
-        buffer = b''
+        buffer = bytearray()
         try:
             while self.running:
                 try:
@@ -108,11 +110,10 @@ class EVCPMonitor:
                     buffer += data
 
                     while len(buffer) > 0:
-                        message, is_valid = Protocol.decode(buffer)
+                        message, is_valid, end = Protocol.decode_frame(buffer, 0)
 
                         if is_valid:
-                            etx_pos = buffer.find(b'\x03')
-                            buffer = buffer[etx_pos + 2:]
+                            del buffer[:end]
 
                             fields = Protocol.parse_message(message)
                             msg_type = fields[0]
@@ -265,7 +266,7 @@ class EVCPMonitor:
                 health_msg = Protocol.encode(
                     Protocol.build_message(MessageTypes.HEALTH_CHECK, self.cp_id)
                 )
-                self.engine_socket.send(health_msg)
+                self.engine_socket.sendall(health_msg)
 
                 # Wait for response with timeout
                 self.engine_socket.settimeout(2)
@@ -293,7 +294,7 @@ class EVCPMonitor:
                                                 MessageTypes.RECOVERY, self.cp_id
                                             )
                                         )
-                                        self.central_socket.send(recovery_msg)
+                                        self.central_socket.sendall(recovery_msg)
 
                                     self.engine_healthy = True
                                     self.consecutive_failures = 0
@@ -336,7 +337,7 @@ class EVCPMonitor:
                         fault_msg = Protocol.encode(
                             Protocol.build_message(MessageTypes.FAULT, self.cp_id)
                         )
-                        self.central_socket.send(fault_msg)
+                        self.central_socket.sendall(fault_msg)
                     except Exception as e:
                         print(f"[{self.cp_id} Monitor] Failed to send fault: {e}")
 
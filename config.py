@@ -7,10 +7,26 @@ import os
 CENTRAL_HOST = "0.0.0.0"
 CENTRAL_PORT = 5000
 CENTRAL_DB_FILE = "central_db.txt"
+CENTRAL_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Threads processing decoded client messages
+CENTRAL_MAX_PENDING = 256  # Queued messages per connection before its reads pause
+CENTRAL_MAX_OUTBUF = 1024 * 1024  # Unsent bytes per connection before it is dropped as a slow consumer
+CENTRAL_SOCKET_BUFFER = int(os.getenv("CENTRAL_SOCKET_BUFFER", 0))  # SO_SNDBUF/SO_RCVBUF per client socket; 0 keeps kernel autotuning
+CENTRAL_KEEPALIVE = (10, 5, 3)  # TCP keepalive idle seconds, probe interval, probes before a peer is dead
+CENTRAL_REACTORS = int(os.getenv("CENTRAL_REACTORS", os.cpu_count() or 1))  # Accept/read loops (SO_REUSEPORT)
+CENTRAL_ADMIN_SOCKET = os.getenv("CENTRAL_ADMIN_SOCKET", "/tmp/ev_central.sock")
+CENTRAL_ADMIN_PORT = int(os.getenv("CENTRAL_ADMIN_PORT", 5099))  # Loopback fallback where AF_UNIX is unavailable
+CENTRAL_STORAGE_QUEUE_SIZE = 10000  # File writes waiting for the storage writer thread
+CENTRAL_LOG_LEVEL = os.getenv("CENTRAL_LOG_LEVEL", "INFO")  # DEBUG adds per-frame send/update lines
+CENTRAL_HTTP_THREADS = int(os.getenv("CENTRAL_HTTP_THREADS", 16))  # REST API request threads (waitress)
 
 # KAFKA Configuration - reads from environment variable or defaults to docker network
 KAFKA_BROKER = os.getenv("KAFKA_BROKER", "kafka:9092")
 
+# Producer batching: let small events coalesce into one broker request
+KAFKA_LINGER_MS = 50
+KAFKA_BATCH_SIZE = 64 * 1024
+KAFKA_QUEUE_SIZE = 10000  # In-process events waiting for the publisher thread
+
 KAFKA_TOPICS = {
     "system_events": "evcharging_system_events",
     "charging_logs": "evcharging_charging_logs",
@@ -51,6 +67,7 @@ WAIT_BETWEEN_REQUESTS = 4
 # Registry Configuration
 REGISTRY_URL = os.getenv("REGISTRY_URL", "http://localhost:5001")
 REGISTRY_POLL_INTERVAL = 10  # Check Registry every 10 seconds
+REGISTRY_POLL_MAX_BACKOFF = 60  # Longest wait between polls while it is unreachable
 
 # Security Configuration
 ENCRYPTION_ENABLED = os.getenv("ENCRYPTION_ENABLED", "True") == "True"
@@ -40,12 +40,13 @@ class EVDriver:
         try:
             self.central_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.central_socket.connect((self.central_host, self.central_port))
+            self.central_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
             # Register with CENTRAL
             register_msg = Protocol.encode(
                 Protocol.build_message(MessageTypes.REGISTER, "DRIVER", self.driver_id)
             )
-            self.central_socket.send(register_msg)
+            self.central_socket.sendall(register_msg)
             print(f"[{self.driver_id}] Registered with CENTRAL")
 
             # Start listening for messages from CENTRAL
@@ -72,12 +73,13 @@ class EVDriver:
             # Create new socket and connect
             self.central_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.central_socket.connect((self.central_host, self.central_port))
+            self.central_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
             # Re-register with CENTRAL
             register_msg = Protocol.encode(
                 Protocol.build_message(MessageTypes.REGISTER, "DRIVER", self.driver_id)
             )
-            self.central_socket.send(register_msg)
+            self.central_socket.sendall(register_msg)
             print(f"[{self.driver_id}] Reconnected and re-registered with CENTRAL")
 
             # Restart listener thread
@@ -95,7 +97,7 @@ class EVDriver:
 
     def _listen_central(self):
         """Listen for messages from CENTRAL"""
-        buffer = b''
+        buffer = bytearray()
         try:
             while self.running:
                 try:
@@ -106,11 +108,10 @@ class EVDriver:
                     buffer += data
 
                     while len(buffer) > 0:
-                        message, is_valid = Protocol.decode(buffer)
+                        message, is_valid, end = Protocol.decode_frame(buffer, 0)
 
                         if is_valid:
-                            etx_pos = buffer.find(b'\x03')
-                            buffer = buffer[etx_pos + 2:]
+                            del buffer[:end]
 
                             fields = Protocol.parse_message(message)
                             msg_type = fields[0]
@@ -253,7 +254,7 @@ class EVDriver:
         )
 
         try:
-            self.central_socket.send(request_msg)
+            self.central_socket.sendall(request_msg)
             print(f"\n[{self.driver_id}] 📤 Requesting charge: {cp_id}, {kwh_needed} kWh\n")
 
             self.kafka.publish_event("charging_logs", "CHARGE_REQUESTED", {
@@ -287,7 +288,7 @@ class EVDriver:
         )
 
         try:
-            self.central_socket.send(end_charge_msg)
+            self.central_socket.sendall(end_charge_msg)
             print(f"\n[{self.driver_id}] 📤 Sent manual end charge request for {cp_id}\n")
 
             # Status will be updated when ticket is received
@@ -299,7 +300,7 @@ class EVDriver:
             if self._reconnect_to_central():
                 # Retry sending the message
                 try:
-                    self.central_socket.send(end_charge_msg)
+                    self.central_socket.sendall(end_charge_msg)
                     print(f"[{self.driver_id}] 📤 Re-sent manual end charge request for {cp_id}\n")
                     return True
                 except Exception as e:
@@ -316,7 +317,7 @@ class EVDriver:
         )
 
         try:
-            self.central_socket.send(query_msg)
+            self.central_socket.sendall(query_msg)
             print(f"\n[{self.driver_id}] 📤 Querying available CPs...\n")
             return True
         except Exception as e:
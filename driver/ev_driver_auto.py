@@ -87,11 +87,12 @@ class EVDriverAuto:
         try:
             self.central_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.central_socket.connect((self.central_host, self.central_port))
+            self.central_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             
             register_msg = Protocol.encode(
                 Protocol.build_message(MessageTypes.REGISTER, "DRIVER", self.driver_id)
             )
-            self.central_socket.send(register_msg)
+            self.central_socket.sendall(register_msg)
             
             print(f"✅ Connected and registered with CENTRAL")
             
@@ -106,7 +107,7 @@ class EVDriverAuto:
 
     def _listen_to_central(self):
         """Listen for messages from CENTRAL"""
-        buffer = b''
+        buffer = bytearray()
         
         try:
             while self.running:
@@ -117,11 +118,10 @@ class EVDriverAuto:
                 buffer += data
                 
                 while len(buffer) > 0:
-                    message, is_valid = Protocol.decode(buffer)
+                    message, is_valid, end = Protocol.decode_frame(buffer, 0)
                     
                     if is_valid:
-                        etx_pos = buffer.find(b'\x03')
-                        buffer = buffer[etx_pos + 2:]
+                        del buffer[:end]
                         
                         fields = Protocol.parse_message(message)
                         msg_type = fields[0]
@@ -221,7 +221,7 @@ class EVDriverAuto:
                                 end_msg = Protocol.encode(
                                     Protocol.build_message(MessageTypes.END_CHARGE, self.driver_id, cp_id)
                                 )
-                                self.central_socket.send(end_msg)
+                                self.central_socket.sendall(end_msg)
                                 print(f"   📤 Sent emergency stop to {cp_id}")
                             except Exception as e:
                                 print(f"   ❌ Failed to send stop: {e}")
@@ -283,7 +283,7 @@ class EVDriverAuto:
         )
         
         try:
-            self.central_socket.send(request_msg)
+            self.central_socket.sendall(request_msg)
             return True
         except Exception as e:
             print(f"❌ Failed to send request: {e}")
@@ -325,7 +325,7 @@ class EVDriverAuto:
         )
         
         try:
-            self.central_socket.send(request_msg)
+            self.central_socket.sendall(request_msg)
             print(f"📤 Sent request: {cp_id}, {kwh_needed} kWh")
             return True
         
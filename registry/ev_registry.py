@@ -174,7 +174,11 @@ def list_cps():
             "registered_at": cp_data['registered_at']
         })
     
-    return jsonify({"charging_points": cps}), 200
+    # EV_Central polls this every few seconds: tag the body so an unchanged
+    # list comes back as an empty 304 to a matching If-None-Match
+    response = jsonify({"charging_points": cps})
+    response.add_etag()
+    return response.make_conditional(request)
 
 if __name__ == "__main__":
     print("[EV_Registry] Starting on port 5001...")
@@ -5,6 +5,7 @@
 import os
 import json
 import threading
+import time
 from datetime import datetime
 
 AUDIT_LOG_FILE = "data/audit_log.txt"
@@ -23,6 +24,7 @@ class AuditLogger:
         self.log_file = log_file
         self.lock = threading.Lock()
         self.enabled = AUDIT_ENABLED
+        self._second = (None, None)  # (epoch second, its ISO prefix)
         
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
         
@@ -42,7 +44,7 @@ class AuditLogger:
         if not self.enabled:
             return
         
-        timestamp = datetime.now().isoformat()
+        timestamp = self._timestamp()
         
         entry = {
             "timestamp": timestamp,
@@ -59,6 +61,16 @@ class AuditLogger:
             except Exception as e:
                 print(f"[AuditLogger] Error writing log: {e}")
     
+    def _timestamp(self):
+        """ISO timestamp; the date and time part is formatted once per second"""
+        now = time.time()
+        second = int(now)
+        cached, prefix = self._second
+        if cached != second:
+            prefix = datetime.fromtimestamp(second).strftime("%Y-%m-%dT%H:%M:%S")
+            self._second = (second, prefix)
+        return f"{prefix}.{int((now - second) * 1_000_000):06d}"
+    
     def log_authentication(self, source_ip, cp_id, success, reason=None):
         """Log authentication attempt"""
         action = "AUTH_SUCCESS" if success else "AUTH_FAILED"
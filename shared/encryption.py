@@ -1,7 +1,15 @@
 from cryptography.fernet import Fernet
+from functools import lru_cache
 import base64
 import hashlib
 
+
+@lru_cache(maxsize=32)
+def _fernet(key: bytes) -> Fernet:
+    """One Fernet per key; building it decodes and splits the key every time"""
+    return Fernet(key)
+
+
 class EncryptionManager:
     @staticmethod
     def generate_key(password: str) -> bytes:
@@ -10,13 +18,13 @@ class EncryptionManager:
         return base64.urlsafe_b64encode(hashed)
     
     @staticmethod
-    def encrypt(message: str, key: bytes) -> str:
-        """Encrypt message"""
-        f = Fernet(key)
-        return f.encrypt(message.encode()).decode()
+    def encrypt(message, key: bytes) -> str:
+        """Encrypt message (str, or bytes that are already encoded)"""
+        if isinstance(message, str):
+            message = message.encode()
+        return _fernet(key).encrypt(message).decode()
     
     @staticmethod
     def decrypt(encrypted: str, key: bytes) -> str:
         """Decrypt message"""
-        f = Fernet(key)
-        return f.decrypt(encrypted.encode()).decode()
\ No newline at end of file
+        return _fernet(key).decrypt(encrypted.encode()).decode()
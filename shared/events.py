@@ -0,0 +1,54 @@
+# ============================================================================
+# EVCharging System - Kafka Event Payloads
+# ============================================================================
+# Fixed-shape payloads for the events EV_Central publishes. orjson serializes
+# dataclasses natively, so these skip the generic dict walk and always produce
+# the same keys in the same order.
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class CPRegistered:
+    cp_id: str
+    location: tuple
+    price: float
+
+
+@dataclass(slots=True)
+class ChargeAuthorized:
+    driver_id: str
+    cp_id: str
+    kwh_needed: float
+
+
+@dataclass(slots=True)
+class ChargeCompleted:
+    cp_id: str
+    driver_id: str
+    total_kwh: float
+    total_amount: float
+
+
+@dataclass(slots=True)
+class ChargeManuallyEnded:
+    cp_id: str
+    driver_id: str
+    total_kwh: float
+    total_amount: float
+    duration_seconds: int
+
+
+@dataclass(slots=True)
+class CPStatus:
+    """CP_FAULT / CP_RECOVERED"""
+    cp_id: str
+
+
+@dataclass(slots=True)
+class WeatherEvent:
+    """WEATHER_ALERT / WEATHER_CLEAR"""
+    cp_id: str
+    location: Optional[str]
+    temperature: float
@@ -192,11 +192,12 @@ class FileStorage:
     # CHARGING HISTORY
     # ========================================================================
 
-    def save_charging_session(self, cp_id, driver_id, kwh_delivered, total_amount, duration_seconds):
+    def save_charging_session(self, cp_id, driver_id, kwh_delivered, total_amount, duration_seconds,
+                              timestamp=None):
         """Save completed charging session to history"""
         with self.lock:
             session = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp or datetime.now().isoformat(),
                 "cp_id": cp_id,
                 "driver_id": driver_id,
                 "kwh_delivered": kwh_delivered,
@@ -0,0 +1,30 @@
+# ============================================================================
+# EVCharging System - orjson for Flask
+# ============================================================================
+# Install with `app.json = ORJSONProvider(app)`: jsonify() and
+# request.get_json() then encode/decode through orjson instead of the
+# stdlib json module. Output is always compact and keys keep their
+# insertion order.
+
+import orjson
+from flask.json.provider import JSONProvider
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    mimetype = "application/json"
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # orjson already produces bytes: skip the str round trip of dumps()
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE),
+            mimetype=self.mimetype,
+        )
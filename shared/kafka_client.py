@@ -2,12 +2,12 @@
 # EVCharging System - Kafka Client for Event Streaming
 # ============================================================================
 
-import json
+import orjson
 import threading
 from kafka import KafkaProducer, KafkaConsumer
 from kafka.errors import KafkaError
 from datetime import datetime
-from config import KAFKA_BROKER, KAFKA_TOPICS
+from config import KAFKA_BROKER, KAFKA_TOPICS, KAFKA_LINGER_MS, KAFKA_BATCH_SIZE
 from shared.encryption import EncryptionManager  # NEW
 
 
@@ -30,37 +30,73 @@ class KafkaClient:
         try:
             self.producer = KafkaProducer(
                 bootstrap_servers=[KAFKA_BROKER],
-                value_serializer=lambda v: json.dumps(v).encode('utf-8'),
-                request_timeout_ms=5000
+                value_serializer=orjson.dumps,
+                request_timeout_ms=5000,
+                linger_ms=KAFKA_LINGER_MS,
+                batch_size=KAFKA_BATCH_SIZE,
+                acks=1
             )
         except Exception as e:
             print(f"[{self.component_name}] Kafka producer connection failed: {e}")
             self.producer = None
 
     def publish_event(self, topic_key, event_type, data):
-        """Publish event to Kafka topic"""
+        """Publish event to Kafka topic
+
+        `data` is a dict or one of the payload dataclasses in shared.events;
+        both serialize to the same JSON object.
+        """
         if self.producer is None:
             return
 
         topic = KAFKA_TOPICS.get(topic_key, "unknown")
         message = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),  # orjson writes ISO 8601 itself
             "component": self.component_name,
             "event_type": event_type,
             "data": data
         }
 
         try:
-            # NEW: Encrypt message if key is set
-            if self.encryption_key:
-                message_str = json.dumps(message)
-                encrypted = EncryptionManager.encrypt(message_str, self.encryption_key)
-                self.producer.send(topic, {"encrypted": encrypted})
-            else:
-                self.producer.send(topic, message)
+            self._send(topic, message)
         except KafkaError as e:
             print(f"[{self.component_name}] Failed to publish: {e}")
 
+    def publish_batch(self, events):
+        """Publish a list of (topic_key, event_type, data) in one pass
+
+        The producer's linger/batch settings turn these into as few broker
+        requests as possible; the timestamp is taken once for the batch.
+        """
+        if self.producer is None or not events:
+            return
+
+        timestamp = datetime.now()
+        failed = 0
+        for topic_key, event_type, data in events:
+            message = {
+                "timestamp": timestamp,
+                "component": self.component_name,
+                "event_type": event_type,
+                "data": data
+            }
+            try:
+                self._send(KAFKA_TOPICS.get(topic_key, "unknown"), message)
+            except KafkaError:
+                failed += 1
+
+        if failed:
+            print(f"[{self.component_name}] Failed to publish {failed}/{len(events)} events")
+
+    def _send(self, topic, message):
+        # NEW: Encrypt message if key is set
+        if self.encryption_key:
+            # orjson already hands back bytes; encrypt them as-is
+            encrypted = EncryptionManager.encrypt(orjson.dumps(message), self.encryption_key)
+            self.producer.send(topic, {"encrypted": encrypted})
+        else:
+            self.producer.send(topic, message)
+
     def start_consumer(self, topic_key, consumer_id, callback=None):
         """Start consuming from a Kafka topic in background thread"""
         topic = KAFKA_TOPICS.get(topic_key, "unknown")
@@ -71,7 +107,7 @@ class KafkaClient:
                     topic,
                     bootstrap_servers=[KAFKA_BROKER],
                     group_id=f"{self.component_name}_{consumer_id}",
-                    value_deserializer=lambda m: json.loads(m.decode('utf-8')),
+                    value_deserializer=orjson.loads,
                     auto_offset_reset='earliest',
                     consumer_timeout_ms=1000
                 )
@@ -84,7 +120,7 @@ class KafkaClient:
                     if self.encryption_key and isinstance(msg_value, dict) and "encrypted" in msg_value:
                         try:
                             decrypted = EncryptionManager.decrypt(msg_value["encrypted"], self.encryption_key)
-                            msg_value = json.loads(decrypted)
+                            msg_value = orjson.loads(decrypted)
                         except Exception as e:
                             print(f"[{self.component_name}] Decryption failed: {e}")
                             continue
@@ -98,6 +134,11 @@ class KafkaClient:
         thread = threading.Thread(target=consume_messages, daemon=True)
         thread.start()
 
+    def flush(self, timeout=None):
+        """Block until every batched event has been sent"""
+        if self.producer:
+            self.producer.flush(timeout)
+
     def close(self):
         """Close all connections"""
         if self.producer:
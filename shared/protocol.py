@@ -4,7 +4,7 @@
 
 from config import STX, ETX, DELIMITER
 from shared.encryption import EncryptionManager  # NEW
-import json  # NEW
+import orjson
 
 
 class Protocol:
@@ -25,54 +25,72 @@ class Protocol:
         
         # NEW: Encrypt if key provided
         if encryption_key:
-            encrypted = EncryptionManager.encrypt(message_bytes.decode(), encryption_key)
-            message_bytes = json.dumps({"encrypted": encrypted}).encode()
+            encrypted = EncryptionManager.encrypt(message_bytes, encryption_key)
+            message_bytes = orjson.dumps({"encrypted": encrypted})
         
-        data = STX + message_bytes + ETX
-        lrc = Protocol.calculate_lrc(data)
-        return data + lrc
+        # LRC covers STX..ETX; fold the delimiters in rather than building
+        # an intermediate STX+DATA+ETX copy, then assemble in one join
+        lrc = Protocol.calculate_lrc(message_bytes)[0] ^ STX[0] ^ ETX[0]
+        return b''.join((STX, message_bytes, ETX, bytes((lrc,))))
 
     @staticmethod
     def decode(raw_data, encryption_key=None):  # NEW: encryption_key param
         """Decode message from <STX><DATA><ETX><LRC>"""
-        if len(raw_data) < 4:
-            return None, False
+        message, is_valid, _ = Protocol.decode_frame(raw_data, 0, encryption_key)
+        return message, is_valid
 
-        if raw_data[0:1] != STX:
-            return None, False
-
-        try:
-            etx_index = raw_data.index(ETX[0], 1)
-        except ValueError:
-            return None, False
-
-        data_part = raw_data[1:etx_index]
-        received_lrc = raw_data[etx_index + 1:etx_index + 2]
-
-        if len(received_lrc) != 1:
-            return None, False
-
-        message_to_check = raw_data[:etx_index + 1]
-        calculated_lrc = Protocol.calculate_lrc(message_to_check)
-
-        if calculated_lrc != received_lrc:
-            return None, False
+    @staticmethod
+    def decode_frame(raw_data, start=0, encryption_key=None, stop=None):
+        """Decode the frame beginning at raw_data[start]
+
+        Returns (message, is_valid, end) where `end` is the offset just past
+        the frame's LRC byte, so callers can keep a read cursor into a
+        receive buffer instead of rescanning it for ETX. `stop` bounds the
+        valid bytes when raw_data is a preallocated buffer.
+        """
+        if stop is None:
+            stop = len(raw_data)
+
+        if stop - start < 4:
+            return None, False, start
+
+        if raw_data[start] != STX[0]:
+            return None, False, start
+
+        etx_index = raw_data.find(ETX, start + 1, stop)
+        if etx_index == -1:
+            return None, False, start
+
+        end = etx_index + 2
+        if end > stop:
+            return None, False, start
+
+        # One copy of the whole frame; XOR-ing STX..ETX together with the
+        # received LRC gives 0 exactly when the LRC matches
+        frame = raw_data[start:end]
+        lrc = 0
+        for byte in frame:
+            lrc ^= byte
+        if lrc:
+            return None, False, start
 
         try:
-            message = data_part.decode('utf-8')
+            message = frame[1:-2].decode('utf-8')
             
             # NEW: Decrypt if encrypted
-            if encryption_key:
+            # Plain '#'-delimited frames never start with '{', so only the
+            # encrypted envelope pays for a JSON parse
+            if encryption_key and message.startswith('{'):
                 try:
-                    msg_dict = json.loads(message)
+                    msg_dict = orjson.loads(message)
                     if "encrypted" in msg_dict:
                         message = EncryptionManager.decrypt(msg_dict["encrypted"], encryption_key)
                 except:
                     pass  # Not encrypted, use as-is
             
-            return message, True
+            return message, True, end
         except Exception:
-            return None, False
+            return None, False, start
 
     @staticmethod
     def parse_message(message):